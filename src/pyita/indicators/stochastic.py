@@ -8,7 +8,8 @@ import numba as nb
 
 from ..indicator_result import IndicatorResult
 from ..move_average import ma_calculate, MA_Type
-from ..exceptions import PyTAExceptionBadParameterValue, PyTAExceptionTooLittleData
+from ..exceptions import PyTAExceptionBadParameterValue, PyTAExceptionBadSeriesData, PyTAExceptionTooLittleData
+from ..constants import PRICE_TYPE
 
 
 @nb.njit(cache=True)
@@ -24,10 +25,11 @@ def calc_k(high, low, close, period):
     Returns:
         Array of %K values (0-100, first period-1 elements are NaN)
     """
-    value_k = np.empty(len(close), dtype=np.float64)
+    n_bars = len(close)
+    value_k = np.empty(n_bars, dtype=PRICE_TYPE)
     value_k[:period - 1] = np.nan
 
-    for i in range(period - 1, len(close)):
+    for i in range(period - 1, n_bars):
         v_high = high[i - period + 1: i + 1].max()
         v_low = low[i - period + 1: i + 1].min()
         value_k[i] = 0 if v_high == v_low else (close[i] - v_low) / (v_high - v_low) * 100
@@ -35,6 +37,243 @@ def calc_k(high, low, close, period):
     return value_k
 
 
+@nb.njit(cache=True)
+def calc_k_batch(highs, lows, closes, period):
+    """Calculate %K (raw stochastic oscillator) for many instruments at once.
+    
+    Arrays are laid out as (n_bars, n_instruments), so the inner loops run over
+    the contiguous instruments axis and can be vectorized.
+    
+    Args:
+        highs: 2D array of high prices (n_bars, n_instruments)
+        lows: 2D array of low prices (n_bars, n_instruments)
+        closes: 2D array of close prices (n_bars, n_instruments)
+        period: Period for calculation
+        
+    Returns:
+        2D array of %K values (0-100, first period-1 rows are NaN)
+    """
+    n_bars, n_instruments = closes.shape
+    value_k = np.empty((n_bars, n_instruments), dtype=PRICE_TYPE)
+    value_k[:period - 1] = np.nan
+
+    v_high = np.empty(n_instruments, dtype=PRICE_TYPE)
+    v_low = np.empty(n_instruments, dtype=PRICE_TYPE)
+
+    for i in range(period - 1, n_bars):
+        start = i - period + 1
+        v_high[:] = highs[start]
+        v_low[:] = lows[start]
+        for k in range(start + 1, i + 1):
+            for j in range(n_instruments):
+                # NaN sticks once it enters the window, as with ndarray.max()/min()
+                v = highs[k, j]
+                if v > v_high[j] or np.isnan(v):
+                    v_high[j] = v
+                v = lows[k, j]
+                if v < v_low[j] or np.isnan(v):
+                    v_low[j] = v
+        for j in range(n_instruments):
+            value_k[i, j] = 0 if v_high[j] == v_low[j] else (closes[i, j] - v_low[j]) / (v_high[j] - v_low[j]) * 100
+
+    return value_k
+
+
+@nb.njit(cache=True)
+def update_window_sum(values, i, width, i_first, window_sum, n_not_finite):
+    """Move a rolling window sum forward to end at bar i.
+    
+    Only finite values are summed, the rest are counted. The sum is rebuilt
+    from scratch every width bars (counting from i_first, the first bar with
+    a full window) to bound rounding drift, as in move_average.sma_window_sums.
+    
+    Args:
+        values: Array of summed values
+        i: Index of the last bar of the window
+        width: Window width
+        i_first: Index of the first bar with a full window
+        window_sum: Sum of finite values of the window ending at bar i - 1
+        n_not_finite: Number of non-finite values in that window
+        
+    Returns:
+        Tuple of (window_sum, n_not_finite) for the window ending at bar i
+    """
+    if (i - i_first) % width == 0:
+        window_sum = 0.0
+        n_not_finite = 0
+        for j in range(i - width + 1, i + 1):
+            if np.isfinite(values[j]):
+                window_sum += values[j]
+            else:
+                n_not_finite += 1
+        return window_sum, n_not_finite
+
+    if np.isfinite(values[i]):
+        window_sum += values[i]
+    else:
+        n_not_finite += 1
+    if np.isfinite(values[i - width]):
+        window_sum -= values[i - width]
+    else:
+        n_not_finite -= 1
+
+    return window_sum, n_not_finite
+
+
+@nb.njit(cache=True)
+def calc_stochastic_sma(high, low, close, period, smooth, period_d):
+    """Calculate %K, smoothed %K and %D with SMA smoothing in a single pass.
+    
+    Window max/min are tracked with monotonic deques (ring buffers of indices),
+    both SMA smoothings with rolling sums (see update_window_sum). NaN values
+    are kept out of the deques and counted instead, so a window containing NaN
+    gives NaN; a smoothing window containing a non-finite value is summed
+    directly. Results match calc_k + sma_calculate; smoothing with width 1
+    copies its input through unchanged.
+    
+    Args:
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of close prices
+        period: Period for %K calculation
+        smooth: Period for smoothing %K
+        period_d: Period for %D calculation
+        
+    Returns:
+        Tuple of (oscillator, value_k, value_d) arrays
+    """
+    n = len(close)
+    oscillator = np.empty(n, dtype=PRICE_TYPE)
+    value_k = np.empty(n, dtype=PRICE_TYPE)
+    value_d = np.empty(n, dtype=PRICE_TYPE)
+
+    max_deque = np.empty(period, dtype=np.int64)
+    min_deque = np.empty(period, dtype=np.int64)
+    max_head = 0
+    max_count = 0
+    min_head = 0
+    min_count = 0
+    high_nans = 0
+    low_nans = 0
+
+    start_oscillator = period - 1
+    start_k = start_oscillator + smooth - 1
+    start_d = start_k + period_d - 1
+    k_sum = 0.0
+    k_bad = 0
+    d_sum = 0.0
+    d_bad = 0
+
+    for i in range(n):
+
+        if max_count > 0 and max_deque[max_head] <= i - period:
+            max_head = (max_head + 1) % period
+            max_count -= 1
+        if i >= period and np.isnan(high[i - period]):
+            high_nans -= 1
+        if np.isnan(high[i]):
+            high_nans += 1
+        else:
+            while max_count > 0 and high[max_deque[(max_head + max_count - 1) % period]] <= high[i]:
+                max_count -= 1
+            max_deque[(max_head + max_count) % period] = i
+            max_count += 1
+
+        if min_count > 0 and min_deque[min_head] <= i - period:
+            min_head = (min_head + 1) % period
+            min_count -= 1
+        if i >= period and np.isnan(low[i - period]):
+            low_nans -= 1
+        if np.isnan(low[i]):
+            low_nans += 1
+        else:
+            while min_count > 0 and low[min_deque[(min_head + min_count - 1) % period]] >= low[i]:
+                min_count -= 1
+            min_deque[(min_head + min_count) % period] = i
+            min_count += 1
+
+        if i < start_oscillator:
+            oscillator[i] = np.nan
+            value_k[i] = np.nan
+            value_d[i] = np.nan
+            continue
+
+        v_high = np.nan if high_nans > 0 else high[max_deque[max_head]]
+        v_low = np.nan if low_nans > 0 else low[min_deque[min_head]]
+        oscillator[i] = 0 if v_high == v_low else (close[i] - v_low) / (v_high - v_low) * 100
+
+        if i < start_k:
+            value_k[i] = np.nan
+            value_d[i] = np.nan
+            continue
+
+        if smooth == 1:
+            value_k[i] = oscillator[i]
+        else:
+            k_sum, k_bad = update_window_sum(oscillator, i, smooth, start_k, k_sum, k_bad)
+            if k_bad == 0:
+                value_k[i] = k_sum / smooth
+            else:
+                value_k[i] = oscillator[i - smooth + 1: i + 1].sum() / smooth
+
+        if i < start_d:
+            value_d[i] = np.nan
+        elif period_d == 1:
+            value_d[i] = value_k[i]
+        else:
+            d_sum, d_bad = update_window_sum(value_k, i, period_d, start_d, d_sum, d_bad)
+            if d_bad == 0:
+                value_d[i] = d_sum / period_d
+            else:
+                value_d[i] = value_k[i - period_d + 1: i + 1].sum() / period_d
+
+    return oscillator, value_k, value_d
+
+
+def batch(quotes_list, period=5):
+    """Calculate raw %K for a list of instruments in one pass.
+    
+    All quotes must have the same length. The data is stacked into
+    (n_bars, n_instruments) matrices and processed by calc_k_batch.
+    
+    Args:
+        quotes_list: List of Quotes objects of equal length
+        period: Period for %K calculation (default: 5)
+        
+    Returns:
+        List of IndicatorResult objects (one per quotes) with attribute:
+            - oscillator: Raw %K values (0-100, first period-1 elements are NaN)
+            
+    Raises:
+        PyTAExceptionBadParameterValue: If period <= 0 or quotes_list is empty
+        PyTAExceptionBadSeriesData: If quotes have different lengths
+        PyTAExceptionTooLittleData: If data length is less than period
+        
+    Example:
+        >>> results = stochastic.batch([quotes_btc, quotes_eth], period=5)
+        >>> print(results[0].oscillator)
+    """
+    if period <= 0:
+        raise PyTAExceptionBadParameterValue(f'period must be greater than 0, got {period}')
+    if len(quotes_list) == 0:
+        raise PyTAExceptionBadParameterValue('quotes_list must not be empty')
+
+    data_len = len(quotes_list[0].close)
+    for quotes in quotes_list:
+        if len(quotes.close) != data_len:
+            raise PyTAExceptionBadSeriesData(f'all quotes must have the same length, got {len(quotes.close)} != {data_len}')
+    if data_len < period:
+        raise PyTAExceptionTooLittleData(f'data length {data_len} < {period}')
+
+    highs = np.column_stack([quotes.high for quotes in quotes_list]).astype(PRICE_TYPE, copy=False)
+    lows = np.column_stack([quotes.low for quotes in quotes_list]).astype(PRICE_TYPE, copy=False)
+    closes = np.column_stack([quotes.close for quotes in quotes_list]).astype(PRICE_TYPE, copy=False)
+
+    oscillators = np.ascontiguousarray(calc_k_batch(highs, lows, closes, period).T)
+
+    return [IndicatorResult({'oscillator': oscillator}) for oscillator in oscillators]
+
+
 def get_indicator_out(quotes, period=5, period_d=3, smooth=3, ma_type='sma'):
     """Calculate Stochastic Oscillator.
     
@@ -87,6 +326,19 @@ def get_indicator_out(quotes, period=5, period_d=3, smooth=3, ma_type='sma'):
     if data_len < period:
         raise PyTAExceptionTooLittleData(f'data length {data_len} < {period}')
     
+    if ma_type_enum == MA_Type.sma:
+        for ma_period in (smooth, period_d):
+            if data_len < ma_period:
+                raise PyTAExceptionTooLittleData(f'data length {data_len} < {ma_period}')
+
+        oscillator, value_k, value_d = calc_stochastic_sma(high, low, close, period, smooth, period_d)
+
+        return IndicatorResult({
+            'oscillator': oscillator,
+            'value_k': value_k,
+            'value_d': value_d
+        })
+
     oscillator = calc_k(high, low, close, period)
     
     value_k = ma_calculate(oscillator, smooth, ma_type_enum)
@@ -9,6 +9,7 @@ import numba as nb
 from ..indicator_result import IndicatorResult
 from ..move_average import MA_Type
 from ..exceptions import PyTAExceptionBadParameterValue, PyTAExceptionTooLittleData
+from ..constants import PRICE_TYPE
 from . import atr
 
 
@@ -30,8 +31,8 @@ def calc_supertrend(close, high, low, atr_values, multiplier, period):
     start_calculation = period - 1
     data_length = len(close)
 
-    super_trend = np.empty(data_length, dtype=np.float64)
-    super_trand_mid = np.empty(data_length, dtype=np.float64)
+    super_trend = np.empty(data_length, dtype=PRICE_TYPE)
+    super_trand_mid = np.empty(data_length, dtype=PRICE_TYPE)
     super_trend[:start_calculation] = np.nan
     super_trand_mid[:start_calculation] = np.nan
 
@@ -40,7 +41,7 @@ def calc_supertrend(close, high, low, atr_values, multiplier, period):
     lower_band = mid - (multiplier * atr_values[start_calculation])
     trend_up = close[start_calculation] >= mid
 
-    for i in range(start_calculation, len(close)):
+    for i in range(start_calculation, data_length):
 
         mid = (high[i] + low[i]) / 2.0
         super_trand_mid[i] = mid
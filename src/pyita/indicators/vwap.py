@@ -45,14 +45,18 @@ def get_indicator_out(quotes):
     if data_len < 1:
         raise PyTAExceptionTooLittleData(f'data length {data_len} < 1')
     
-    # Calculate typical price
-    typical_price = (high + low + close) / 3
+    # Calculate typical price in a single preallocated buffer
+    vwap = np.empty_like(close)
+    np.add(high, low, out=vwap)
+    np.add(vwap, close, out=vwap)
+    vwap *= 1.0 / 3.0
     
-    # Calculate VWAP
-    np.seterr(divide='ignore', invalid='ignore')
-    typical_price_volume = typical_price * volume
+    # Calculate VWAP in place: cumsum(typical_price * volume) / cumsum(volume)
+    vwap *= volume
+    np.cumsum(vwap, out=vwap)
     volume_sum = np.cumsum(volume)
-    vwap = np.cumsum(typical_price_volume) / volume_sum
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(vwap, volume_sum, out=vwap)
     
     return IndicatorResult({
         'vwap': vwap
@@ -80,7 +80,6 @@ def get_indicator_out(quotes, period, value='close'):
     if data_len < period:
         raise PyTAExceptionTooLittleData(f'data length {data_len} < {period}')
     
-    np.seterr(divide='ignore', invalid='ignore')
     vwma = vwma_calculate(source_values, volume, period)
     
     return IndicatorResult({
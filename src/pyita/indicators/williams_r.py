@@ -7,7 +7,8 @@ import numpy as np
 import numba as nb
 
 from ..indicator_result import IndicatorResult
-from ..exceptions import PyTAExceptionBadParameterValue, PyTAExceptionTooLittleData
+from ..exceptions import PyTAExceptionBadParameterValue, PyTAExceptionBadSeriesData, PyTAExceptionTooLittleData
+from ..constants import PRICE_TYPE
 
 
 @nb.njit(cache=True)
@@ -25,7 +26,7 @@ def calc_williams(high, low, close, period):
     """
     n_bars = len(high)
 
-    williams_r = np.empty(n_bars, dtype=float)
+    williams_r = np.empty(n_bars, dtype=PRICE_TYPE)
 
     williams_r[: period - 1] = np.nan
     for t in range(period - 1, n_bars):
@@ -36,6 +37,92 @@ def calc_williams(high, low, close, period):
     return williams_r
 
 
+@nb.njit(cache=True)
+def calc_williams_batch(highs, lows, closes, period):
+    """Calculate Williams %R oscillator for many instruments at once.
+    
+    Arrays are laid out as (n_bars, n_instruments), so the inner loops run over
+    the contiguous instruments axis and can be vectorized.
+    
+    Args:
+        highs: 2D array of high prices (n_bars, n_instruments)
+        lows: 2D array of low prices (n_bars, n_instruments)
+        closes: 2D array of close prices (n_bars, n_instruments)
+        period: Period for calculation
+        
+    Returns:
+        2D array of Williams %R values (first period-1 rows are NaN)
+    """
+    n_bars, n_instruments = closes.shape
+    williams_r = np.empty((n_bars, n_instruments), dtype=PRICE_TYPE)
+    williams_r[: period - 1] = np.nan
+
+    high_max = np.empty(n_instruments, dtype=PRICE_TYPE)
+    low_min = np.empty(n_instruments, dtype=PRICE_TYPE)
+
+    for t in range(period - 1, n_bars):
+        start = t - period + 1
+        high_max[:] = highs[start]
+        low_min[:] = lows[start]
+        for k in range(start + 1, t + 1):
+            for j in range(n_instruments):
+                # NaN sticks once it enters the window, as with ndarray.max()/min()
+                v = highs[k, j]
+                if v > high_max[j] or np.isnan(v):
+                    high_max[j] = v
+                v = lows[k, j]
+                if v < low_min[j] or np.isnan(v):
+                    low_min[j] = v
+        for j in range(n_instruments):
+            williams_r[t, j] = 0 if high_max[j] == low_min[j] else (closes[t, j] - high_max[j]) / (high_max[j] - low_min[j]) * 100
+
+    return williams_r
+
+
+def batch(quotes_list, period=14):
+    """Calculate Williams %R for a list of instruments in one pass.
+    
+    All quotes must have the same length. The data is stacked into
+    (n_bars, n_instruments) matrices and processed by calc_williams_batch.
+    
+    Args:
+        quotes_list: List of Quotes objects of equal length
+        period: Period for calculation (default: 14)
+        
+    Returns:
+        List of IndicatorResult objects (one per quotes) with attribute:
+            - williams_r: Williams %R values (-100 to 0, first period-1 elements are NaN)
+            
+    Raises:
+        PyTAExceptionBadParameterValue: If period <= 0 or quotes_list is empty
+        PyTAExceptionBadSeriesData: If quotes have different lengths
+        PyTAExceptionTooLittleData: If data length is less than period
+        
+    Example:
+        >>> results = williams_r.batch([quotes_btc, quotes_eth], period=14)
+        >>> print(results[0].williams_r)
+    """
+    if period <= 0:
+        raise PyTAExceptionBadParameterValue(f'period must be greater than 0, got {period}')
+    if len(quotes_list) == 0:
+        raise PyTAExceptionBadParameterValue('quotes_list must not be empty')
+
+    data_len = len(quotes_list[0].close)
+    for quotes in quotes_list:
+        if len(quotes.close) != data_len:
+            raise PyTAExceptionBadSeriesData(f'all quotes must have the same length, got {len(quotes.close)} != {data_len}')
+    if data_len < period:
+        raise PyTAExceptionTooLittleData(f'data length {data_len} < {period}')
+
+    highs = np.column_stack([quotes.high for quotes in quotes_list]).astype(PRICE_TYPE, copy=False)
+    lows = np.column_stack([quotes.low for quotes in quotes_list]).astype(PRICE_TYPE, copy=False)
+    closes = np.column_stack([quotes.close for quotes in quotes_list]).astype(PRICE_TYPE, copy=False)
+
+    williams_r = np.ascontiguousarray(calc_williams_batch(highs, lows, closes, period).T)
+
+    return [IndicatorResult({'williams_r': values}) for values in williams_r]
+
+
 def get_indicator_out(quotes, period=14):
     """Calculate Williams %R oscillator.
     
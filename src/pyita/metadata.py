@@ -1,11 +1,22 @@
 """Metadata management for indicators."""
-import importlib
+import ast
+import functools
 import json
+import os
 import re
 from pathlib import Path
 
 from .exceptions import PyTAExceptionMetadataParseError, PyTAExceptionMetadataError
 
+_SIGNATURE_RE = re.compile(r'(\w+)\((.*?)\)')
+_SERIES_TYPE_RE = re.compile(r'(\w+)\s*\(([^)]+)\)')
+
+# Output series type as written in docstrings -> normalized type; anything else is 'none'
+_TYPE_NORMALIZE = {'as source': 'as_source', 'as_source': 'as_source', 'price': 'price'}
+
+# Formatted list() output keyed by (path, mtime) of the metadata file
+_LIST_CACHE = {}
+
 
 def _parse_docstring(indicator_name, docstring):
     """Parse indicator docstring and extract metadata.
@@ -38,8 +49,7 @@ def _parse_docstring(indicator_name, docstring):
             "docstring is empty or missing"
         )
     
-    lines = [line.strip() for line in docstring.strip().split('\n')]
-    lines = [line for line in lines if line]
+    lines = [line for line in (raw_line.strip() for raw_line in docstring.splitlines()) if line]
     
     if len(lines) < 3:
         raise PyTAExceptionMetadataParseError(
@@ -61,12 +71,8 @@ def _parse_docstring(indicator_name, docstring):
             f"indicator name mismatch: expected '{indicator_name}', got '{name_from_signature}'"
         )
     
+    # lines holds only non-empty lines, so the description is never empty
     description_line = lines[1]
-    if not description_line:
-        raise PyTAExceptionMetadataParseError(
-            indicator_name,
-            "description line is empty"
-        )
     
     output_series_line = None
     for line in lines[2:]:
@@ -89,15 +95,10 @@ def _parse_docstring(indicator_name, docstring):
             continue
         
         # Parse format: "name (type)" or just "name"
-        type_match = re.match(r'(\w+)\s*\(([^)]+)\)', series_item)
+        type_match = _SERIES_TYPE_RE.match(series_item)
         if type_match:
             series_name = type_match.group(1)
-            series_type = type_match.group(2).strip()
-            # Normalize type: "as source" -> "as_source"
-            if series_type == 'as source':
-                series_type = 'as_source'
-            elif series_type not in ('price', 'as_source'):
-                series_type = 'none'
+            series_type = _TYPE_NORMALIZE.get(type_match.group(2).strip(), 'none')
         else:
             series_name = series_item
             series_type = 'none'
@@ -107,7 +108,7 @@ def _parse_docstring(indicator_name, docstring):
             'type': series_type
         })
     
-    signature_match = re.match(r'(\w+)\((.*?)\)', signature_line)
+    signature_match = _SIGNATURE_RE.match(signature_line)
     if not signature_match:
         raise PyTAExceptionMetadataParseError(
             indicator_name,
@@ -138,8 +139,9 @@ def _parse_docstring(indicator_name, docstring):
 def create_metadata():
     """Create metadata JSON file from all indicator modules.
     
-    Scans indicators directory, imports each module, parses docstrings,
-    and saves metadata to metadata.json file.
+    Scans indicators directory, reads each module docstring from its source
+    (modules are parsed with ast, not imported), parses docstrings,
+    and atomically saves compact metadata to metadata.json file.
     
     Raises:
         PyTAExceptionMetadataParseError: If parsing fails for any indicator
@@ -154,8 +156,8 @@ def create_metadata():
         indicator_name = py_file.stem
         
         try:
-            module = importlib.import_module(f'pyita.indicators.{indicator_name}')
-            docstring = module.__doc__
+            tree = ast.parse(py_file.read_text(encoding='utf-8'))
+            docstring = ast.get_docstring(tree, clean=False)
             
             metadata = _parse_docstring(indicator_name, docstring)
             metadata_dict[indicator_name] = metadata
@@ -165,41 +167,57 @@ def create_metadata():
                 raise
             raise PyTAExceptionMetadataParseError(
                 indicator_name,
-                f"error importing or parsing module: {str(e)}"
+                f"error reading or parsing module: {str(e)}"
             ) from e
     
+    # Write to a temporary file and rename it, so readers never see a partial file
     metadata_file = Path(__file__).parent / 'metadata.json'
-    with open(metadata_file, 'w', encoding='utf-8') as f:
-        json.dump(metadata_dict, f, indent=2, ensure_ascii=False)
+    tmp_file = metadata_file.with_suffix('.json.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(metadata_dict, f, separators=(',', ':'), ensure_ascii=False)
+    os.replace(tmp_file, metadata_file)
 
 
-def metadata():
-    """Get metadata for all indicators.
-    
-    Reads metadata from metadata.json file.
+def _metadata_cache_key():
+    """Get cache key for the metadata file.
     
     Returns:
-        dict: Dictionary mapping indicator names to their metadata.
-              Each metadata dict contains:
-              - name: Indicator name
-              - signature: Full signature string
-              - parameters: List of parameter names
-              - output_series: List of output series names
-              - description: Description string
-              
+        tuple: (path, mtime) of metadata.json
+        
     Raises:
-        PyTAExceptionMetadataParseError: If metadata file is missing or invalid
+        PyTAExceptionMetadataError: If metadata file is missing
     """
     metadata_file = Path(__file__).parent / 'metadata.json'
     
-    if not metadata_file.exists():
+    try:
+        mtime = metadata_file.stat().st_mtime_ns
+    except FileNotFoundError:
         raise PyTAExceptionMetadataError(
             f"metadata file not found: {metadata_file}. Run create_metadata() first."
         )
     
+    return str(metadata_file), mtime
+
+
+@functools.lru_cache(maxsize=1)
+def _load_metadata(path_str, mtime):
+    """Load and parse metadata file.
+    
+    Cached by (path, mtime), so the file is parsed again only after it changes.
+    
+    Args:
+        path_str: Path to metadata.json
+        mtime: Modification time of the file (part of the cache key)
+        
+    Returns:
+        dict: Parsed metadata dictionary
+        
+    Raises:
+        PyTAExceptionMetadataError: If metadata file is invalid or cannot be read
+    """
     try:
-        with open(metadata_file, 'r', encoding='utf-8') as f:
-            metadata_dict = json.load(f)
+        with open(path_str, 'r', encoding='utf-8') as f:
+            return json.load(f)
     except json.JSONDecodeError as e:
         raise PyTAExceptionMetadataError(
             f"invalid JSON in metadata file: {str(e)}"
@@ -208,8 +226,28 @@ def metadata():
         raise PyTAExceptionMetadataError(
             f"error reading metadata file: {str(e)}"
         ) from e
+
+
+def metadata():
+    """Get metadata for all indicators.
     
-    return metadata_dict
+    Reads metadata from metadata.json file. The parsed file is cached and
+    re-read only when its modification time changes, so the returned dict is
+    shared between calls and must not be modified.
+    
+    Returns:
+        dict: Dictionary mapping indicator names to their metadata.
+              Each metadata dict contains:
+              - name: Indicator name
+              - signature: Full signature string
+              - parameters: List of parameter names
+              - output_series: List of output series names
+              - description: Description string
+              
+    Raises:
+        PyTAExceptionMetadataError: If metadata file is missing or invalid
+    """
+    return _load_metadata(*_metadata_cache_key())
 
 
 def list():
@@ -222,7 +260,11 @@ def list():
     Raises:
         PyTAExceptionMetadataError: If metadata file is missing or invalid
     """
-    metadata_dict = metadata()
+    cache_key = _metadata_cache_key()
+    if cache_key in _LIST_CACHE:
+        return _LIST_CACHE[cache_key]
+    
+    metadata_dict = _load_metadata(*cache_key)
     
     lines = []
     for indicator_name in sorted(metadata_dict.keys()):
@@ -245,5 +287,7 @@ def list():
         lines.append(f"  Output: {', '.join(output_series_formatted)}")
         lines.append('')
     
-    return '\n'.join(lines)
+    _LIST_CACHE.clear()
+    _LIST_CACHE[cache_key] = '\n'.join(lines)
+    return _LIST_CACHE[cache_key]
 
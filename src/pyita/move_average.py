@@ -3,6 +3,9 @@ from numba import njit
 from enum import Enum
 from .exceptions import PyTAExceptionTooLittleData
 
+# Up to this period direct convolution is faster than the sliding-sum SMA kernel
+SMA_CONVOLVE_MAX_PERIOD = 10
+
 
 class MA_Type(Enum):
 
@@ -17,22 +20,21 @@ class MA_Type(Enum):
     @staticmethod
     def cast(str_value):
 
-        if str_value == 'ema':  # Classic EMA with initialization via SMA (alpha = 2.0 / (period + 1))
-            return MA_Type.ema
-        if str_value == 'sma':  # Classic SMA with initialization via SMA
-            return MA_Type.sma
-        if str_value == 'mma':  # Modified EMA with initialization via SMA (alpha = 1.0 / period)
-            return MA_Type.mma
-        if str_value == 'ema0':  # Classic EMA with initialization via first data element
-            return MA_Type.ema0
-        if str_value == 'mma0':  # Modified EMA with initialization via first data element (alpha = 1.0 / period)
-            return MA_Type.mma0
-        if str_value == 'emaw':  # EMA with dynamic-alpha warm-up (TA-Lib compatible)
-            return MA_Type.ema_warmup
-        if str_value == 'mmaw':  # MMA (SMMA) with dynamic-alpha warm-up (TA-Lib compatible)
-            return MA_Type.mma_warmup
+        try:
+            return _MA_CAST_TABLE[str_value]
+        except (KeyError, TypeError):
+            raise ValueError(f'Unknown move average type: {str_value}') from None
+
 
-        raise ValueError(f'Unknown move average type: {str_value}')
+_MA_CAST_TABLE = {
+    'ema': MA_Type.ema,  # Classic EMA with initialization via SMA (alpha = 2.0 / (period + 1))
+    'sma': MA_Type.sma,  # Classic SMA with initialization via SMA
+    'mma': MA_Type.mma,  # Modified EMA with initialization via SMA (alpha = 1.0 / period)
+    'ema0': MA_Type.ema0,  # Classic EMA with initialization via first data element
+    'mma0': MA_Type.mma0,  # Modified EMA with initialization via first data element (alpha = 1.0 / period)
+    'emaw': MA_Type.ema_warmup,  # EMA with dynamic-alpha warm-up (TA-Lib compatible)
+    'mmaw': MA_Type.mma_warmup,  # MMA (SMMA) with dynamic-alpha warm-up (TA-Lib compatible)
+}
 
 
 @njit(cache=True)
@@ -72,6 +74,46 @@ def ema_calculate(source_values, alpha, first_value=np.nan, start=0):
     return result
 
 
+@njit(cache=True)
+def sma_window_sums(source_values, period):
+
+    # Rolling window sum over finite values; non-finite values are counted instead,
+    # and windows containing them are summed directly, so NaN and inf stay local
+    # to their windows. The sum is rebuilt every period bars to bound rounding drift.
+    data_len = len(source_values)
+    result = np.empty(data_len, dtype=np.float64)
+    result[: period - 1] = np.nan
+
+    window_sum = 0.0
+    n_not_finite = 0
+    for i in range(period - 1, data_len):
+        first = i - period + 1
+        if first % period == 0:
+            window_sum = 0.0
+            n_not_finite = 0
+            for j in range(first, i + 1):
+                if np.isfinite(source_values[j]):
+                    window_sum += source_values[j]
+                else:
+                    n_not_finite += 1
+        else:
+            if np.isfinite(source_values[i]):
+                window_sum += source_values[i]
+            else:
+                n_not_finite += 1
+            if np.isfinite(source_values[first - 1]):
+                window_sum -= source_values[first - 1]
+            else:
+                n_not_finite -= 1
+
+        if n_not_finite == 0:
+            result[i] = window_sum
+        else:
+            result[i] = source_values[first: i + 1].sum()
+
+    return result
+
+
 def sma_calculate(source_values, period):
 
     if period == 1:
@@ -81,10 +123,14 @@ def sma_calculate(source_values, period):
     if data_len < period:
         raise PyTAExceptionTooLittleData(f'data length {data_len} < {period}')
 
-    weights = np.ones(period, dtype=source_values.dtype) / period
+    if period <= SMA_CONVOLVE_MAX_PERIOD:
+        weights = np.ones(period, dtype=source_values.dtype) / period
+        out = np.convolve(source_values, weights)[:-period+1]
+        out[:period - 1] = np.nan
+        return out
 
-    out = np.convolve(source_values, weights)[:-period+1]
-    out[:period - 1] = np.nan
+    out = sma_window_sums(source_values, period)
+    out[period - 1:] /= period
 
     return out
 
@@ -101,16 +147,13 @@ def iema_calculate(source_values, period, alpha):
     return ema_calculate(source_values, alpha, first_value, start + period - 1)
 
 
-@njit(cache=True)
 def ema_warmup_init(source_values, period, start):
 
-    init_ema = source_values[start]
+    # The warm-up recurrence with dynamic alpha k = 1 / (i + 1) gives every one of the
+    # first period values the same weight 1 / period, so it reduces to a single dot product
+    weights = np.full(period, 1.0 / period)
 
-    for i in range(1, period):
-        k = 1.0 / (i + 1)
-        init_ema = source_values[start + i] * k + init_ema * (1.0 - k)
-
-    return init_ema
+    return float(np.dot(weights, source_values[start: start + period]))
 
 
 def ema_warmup_calculate(source_values, period, alpha):
@@ -132,27 +175,21 @@ def ema_warmup_calculate(source_values, period, alpha):
     return result
 
 
+_MA_CALC_TABLE = {
+    MA_Type.sma: sma_calculate,
+    MA_Type.ema0: lambda source_values, period: ema_calculate(source_values, 2.0 / (period + 1)),
+    MA_Type.mma0: lambda source_values, period: ema_calculate(source_values, 1.0 / period),
+    MA_Type.ema: lambda source_values, period: iema_calculate(source_values, period, 2.0 / (period + 1)),
+    MA_Type.mma: lambda source_values, period: iema_calculate(source_values, period, 1.0 / period),
+    MA_Type.ema_warmup: lambda source_values, period: ema_warmup_calculate(source_values, period, 2.0 / (period + 1)),
+    MA_Type.mma_warmup: lambda source_values, period: ema_warmup_calculate(source_values, period, 1.0 / period),
+}
+
+
 def ma_calculate(source_values, period, ma_type):
 
-    if ma_type == MA_Type.sma:
-        return sma_calculate(source_values, period)
-    if ma_type == MA_Type.ema0:
-        alpha = 2.0 / (period + 1)
-        return ema_calculate(source_values, alpha)
-    if ma_type == MA_Type.mma0:
-        alpha = 1.0 / period
-        return ema_calculate(source_values, alpha)
-    if ma_type == MA_Type.ema:
-        alpha = 2.0 / (period + 1)
-        return iema_calculate(source_values, period, alpha)
-    if ma_type == MA_Type.mma:
-        alpha = 1.0 / period
-        return iema_calculate(source_values, period, alpha)
-    if ma_type == MA_Type.ema_warmup:
-        alpha = 2.0 / (period + 1)
-        return ema_warmup_calculate(source_values, period, alpha)
-    if ma_type == MA_Type.mma_warmup:
-        alpha = 1.0 / period
-        return ema_warmup_calculate(source_values, period, alpha)
-
-    raise ValueError(f'Bad ma_type value: {ma_type}')
+    calculate = _MA_CALC_TABLE.get(ma_type)
+    if calculate is None:
+        raise ValueError(f'Bad ma_type value: {ma_type}')
+
+    return calculate(source_values, period)
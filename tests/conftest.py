@@ -6,6 +6,8 @@ from pathlib import Path
 import numpy as np
 import pytest
 
+import pyita as ta
+
 
 def pytest_configure(config):
     """Configure pytest environment variables for stock-indicators."""
@@ -50,16 +52,13 @@ def arrays_equal_with_nan(arr1, arr2, rtol=COMPARISON_TOLERANCE, atol=COMPARISON
     if arr1.shape != arr2.shape:
         return False
     
-    # Create masks for NaN values
-    nan_mask1 = np.isnan(arr1)
-    nan_mask2 = np.isnan(arr2)
-    
     # Check that NaN positions match
-    if not np.array_equal(nan_mask1, nan_mask2):
+    nan_mask = np.isnan(arr1)
+    if (nan_mask != np.isnan(arr2)).any():
         return False
     
     # For non-NaN positions, compare with isclose
-    non_nan_mask = ~nan_mask1
+    non_nan_mask = ~nan_mask
     if np.any(non_nan_mask):
         return np.allclose(
             arr1[non_nan_mask],
@@ -73,10 +72,26 @@ def arrays_equal_with_nan(arr1, arr2, rtol=COMPARISON_TOLERANCE, atol=COMPARISON
     return True
 
 
-@pytest.fixture
+def first_non_nan_index(arr):
+    """Get index of the first non-NaN value.
+    
+    Args:
+        arr: numpy array
+        
+    Returns:
+        int: Index of the first non-NaN value, or len(arr) if all values are NaN
+    """
+    not_nan = ~np.isnan(arr)
+    return int(np.argmax(not_nan)) if not_nan.any() else len(arr)
+
+
+@pytest.fixture(scope="session")
 def test_ohlcv_data():
     """Load OHLCV test data from pickle file.
     
+    The data is loaded once per session and shared between tests,
+    so the arrays are read-only.
+    
     Returns:
         dict: Dictionary with keys 'time', 'open', 'high', 'low', 'close', 'volume'
             containing numpy arrays of OHLCV data
@@ -101,5 +116,33 @@ def test_ohlcv_data():
     for key in required_keys:
         assert key in data_dict, f"Missing key '{key}' in test data"
     
+    # TA-Lib expects contiguous float64 input (no copy if the data already is)
+    for key in ('open', 'high', 'low', 'close', 'volume'):
+        data_dict[key] = np.ascontiguousarray(data_dict[key], dtype=np.float64)
+    
+    for arr in data_dict.values():
+        arr.setflags(write=False)
+    
     return data_dict
 
+
+
+@pytest.fixture(scope="session")
+def quotes(test_ohlcv_data):
+    """Build read-only Quotes from the OHLCV test data.
+    
+    Built once per session and shared between tests.
+    
+    Returns:
+        Quotes: Quotes object with open, high, low, close, volume and time
+    """
+    quotes = ta.Quotes(
+        test_ohlcv_data['open'],
+        test_ohlcv_data['high'],
+        test_ohlcv_data['low'],
+        test_ohlcv_data['close'],
+        test_ohlcv_data['volume'],
+        test_ohlcv_data['time'],
+    )
+    quotes.writeable = False
+    return quotes
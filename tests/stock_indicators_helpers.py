@@ -1,4 +1,8 @@
 """Helpers for converting data between pyita and stock-indicators formats."""
+import functools
+import hashlib
+import operator
+import os
 import pickle
 from pathlib import Path
 
@@ -7,6 +11,9 @@ from pyita.indicator_result import IndicatorResult
 
 TEST_DATA_DIR = Path(__file__).parent / 'test_data'
 
+# Maps quotes content hashes used in cache names to quotes filenames
+QUOTES_HASH_INDEX = TEST_DATA_DIR / 'si_ref.idx'
+
 
 def quotes_to_si(quotes):
     """Convert pyita Quotes object to list of stock-indicators Quote objects.
@@ -44,15 +51,15 @@ def si_results_to_numpy(results, attrs):
     output = {}
 
     for attr in attrs:
-        arr = np.empty(n, dtype=np.float64)
-        for i, r in enumerate(results):
-            val = getattr(r, attr)
-            arr[i] = np.nan if val is None else float(val)
-        output[attr] = arr
+        values = map(operator.attrgetter(attr), results)
+        output[attr] = np.fromiter(
+            (np.nan if val is None else val for val in values), dtype=np.float64, count=n
+        )
 
     return output
 
 
+@functools.cache
 def get_si_ref(quotes_filename, si_func_name, *args):
     """Get cached stock-indicators reference values.
 
@@ -66,6 +73,9 @@ def get_si_ref(quotes_filename, si_func_name, *args):
                String values for enum types (e.g., 'HIGH_LOW', 'SHORT', 'LONG')
                will be automatically converted to enum objects when generating data.
 
+    Results are memoized per process, so the returned object is shared
+    between tests and its arrays are read-only.
+
     Returns:
         IndicatorResult: Object with attribute access to numpy arrays
     """
@@ -74,7 +84,7 @@ def get_si_ref(quotes_filename, si_func_name, *args):
     # If cache exists, load from cache (no need for stock-indicators)
     if cache_path.exists():
         with open(cache_path, 'rb') as f:
-            return IndicatorResult(pickle.load(f))
+            return _read_only_result(pickle.load(f))
 
     # Cache doesn't exist - need to generate it using stock-indicators
     # Convert string enum arguments to enum objects before calling stock-indicators
@@ -97,10 +107,22 @@ def get_si_ref(quotes_filename, si_func_name, *args):
     results = func(si_quotes, *converted_args)
     data_dict = _extract_all_attrs(results)
 
-    with open(cache_path, 'wb') as f:
+    # Write to a per-process temporary file and rename it, so parallel test
+    # workers (pytest-xdist) never load a partially written reference
+    tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_path, 'wb') as f:
         pickle.dump(data_dict, f)
+    os.replace(tmp_path, cache_path)
+    _record_quotes_hash(quotes_filename)
+
+    return _read_only_result(data_dict)
 
-    return IndicatorResult(data_dict)
+
+def _read_only_result(data_dict):
+    """Wrap reference arrays into a read-only IndicatorResult."""
+    result = IndicatorResult(data_dict)
+    result.writeable = False
+    return result
 
 
 def _format_arg_for_filename(arg):
@@ -114,10 +136,37 @@ def _format_arg_for_filename(arg):
     return str(arg)
 
 
+@functools.cache
+def _quotes_hash(quotes_filename):
+    """Get content hash of a quotes file.
+    
+    The hash is part of reference cache names, so references are regenerated
+    when the quotes data changes.
+    """
+    data = (TEST_DATA_DIR / quotes_filename).read_bytes()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _record_quotes_hash(quotes_filename):
+    """Record the quotes file hash in QUOTES_HASH_INDEX.
+    
+    Keeps reference cache names traceable to their quotes file. Called only
+    when a reference pickle is generated, so plain test runs never write to
+    the index.
+    """
+    index_line = f'{_quotes_hash(quotes_filename)} {quotes_filename}'
+    index_lines = QUOTES_HASH_INDEX.read_text(encoding='utf-8').splitlines() if QUOTES_HASH_INDEX.exists() else []
+    if index_line not in index_lines:
+        with open(QUOTES_HASH_INDEX, 'a', encoding='utf-8') as f:
+            f.write(index_line + '\n')
+
+
+@functools.lru_cache(maxsize=128)
 def _build_cache_path(quotes_filename, si_func_name, args):
     quotes_base = quotes_filename.replace('.pkl', '')
+    quotes_hash = _quotes_hash(quotes_filename)
     params_suffix = '-' + ','.join(_format_arg_for_filename(a) for a in args) if args else ''
-    cache_name = f'si_ref-{si_func_name}-{quotes_base}{params_suffix}.pkl'
+    cache_name = f'si_ref-{si_func_name}-{quotes_base}-{quotes_hash}{params_suffix}.pkl'
     return TEST_DATA_DIR / cache_name
 
 
@@ -128,26 +177,21 @@ def _dict_to_si_quotes(data_dict):
     """
     from stock_indicators import Quote
 
-    time = data_dict['time']
-    open_data = data_dict['open']
-    high = data_dict['high']
-    low = data_dict['low']
-    close = data_dict['close']
-    volume = data_dict['volume']
-
-    result = []
-    for i in range(len(close)):
-        result.append(Quote(
-            date=time[i].astype('datetime64[ms]').item(),
-            open=float(open_data[i]),
-            high=float(high[i]),
-            low=float(low[i]),
-            close=float(close[i]),
-            volume=float(volume[i]),
-        ))
-    return result
+    # Convert whole columns to Python objects at once instead of per element
+    dates = np.asarray(data_dict['time']).astype('datetime64[ms]').tolist()
+    opens = np.asarray(data_dict['open'], dtype=np.float64).tolist()
+    highs = np.asarray(data_dict['high'], dtype=np.float64).tolist()
+    lows = np.asarray(data_dict['low'], dtype=np.float64).tolist()
+    closes = np.asarray(data_dict['close'], dtype=np.float64).tolist()
+    volumes = np.asarray(data_dict['volume'], dtype=np.float64).tolist()
+
+    return [
+        Quote(date=date, open=open_value, high=high, low=low, close=close, volume=volume)
+        for date, open_value, high, low, close, volume in zip(dates, opens, highs, lows, closes, volumes)
+    ]
 
 
+@functools.lru_cache(maxsize=128)
 def _convert_args_to_enums(si_func_name, args):
     """Convert string enum arguments to enum objects.
     
@@ -184,41 +228,39 @@ def _convert_args_to_enums(si_func_name, args):
     return tuple(args_list)
 
 
+@functools.lru_cache(maxsize=32)
+def _property_names(result_class):
+    """Get names of public properties (except date) of a stock-indicators result class."""
+    return tuple(
+        name for name in dir(result_class)
+        if isinstance(getattr(result_class, name, None), property)
+        and name != 'date' and not name.startswith('_')
+    )
+
+
 def _extract_all_attrs(results):
     """Extract all attributes from stock-indicators results.
     
     Handles both numeric and string values (e.g., point_type in ZigZag).
     """
     result_class = type(results[0])
-    attrs = [
-        name for name in dir(result_class)
-        if isinstance(getattr(result_class, name, None), property)
-        and name != 'date' and not name.startswith('_')
-    ]
 
-    n = len(results)
     data_dict = {}
-    for attr in attrs:
+    for attr in _property_names(result_class):
+        # Call the property getter directly instead of getattr() per element
+        fget = getattr(result_class, attr).fget
+        values = list(map(fget, results))
+
         # Determine dtype by checking first non-None value
-        dtype = np.float64
-        for r in results:
-            val = getattr(r, attr)
-            if val is not None:
-                if isinstance(val, str):
-                    dtype = object
-                break
-        
-        if dtype == object:
-            arr = np.empty(n, dtype=object)
-            for i, r in enumerate(results):
-                val = getattr(r, attr)
-                arr[i] = None if val is None else val
+        first_value = next((val for val in values if val is not None), None)
+
+        if isinstance(first_value, str):
+            arr = np.empty(len(values), dtype=object)
+            arr[:] = values
         else:
-            arr = np.empty(n, dtype=np.float64)
-            for i, r in enumerate(results):
-                val = getattr(r, attr)
-                arr[i] = np.nan if val is None else float(val)
+            arr = np.fromiter(
+                (np.nan if val is None else val for val in values), dtype=np.float64, count=len(values)
+            )
         data_dict[attr] = arr
 
     return data_dict
-
@@ -2,18 +2,17 @@
 import numpy as np
 import pytest
 import pyita as ta
-import talib
 
 from conftest import arrays_equal_with_nan
 
 
 @pytest.mark.parametrize('ma_period', [2, 14])
-def test_adl_vs_talib(test_ohlcv_data, ma_period):
+def test_adl_vs_talib(test_ohlcv_data, quotes, ma_period):
     """Test ADL calculation against TA-Lib reference implementation.
     
     This test:
     1. Loads test OHLCV data
-    2. Creates Quotes object
+    2. Uses shared Quotes object
     3. Calculates ADL using pyita
     4. Calculates ADL using TA-Lib
     5. Compares results with tolerance
@@ -22,8 +21,9 @@ def test_adl_vs_talib(test_ohlcv_data, ma_period):
     ma_type='sma' is fixed (default).
     Note: This test only compares the base ADL values, not adl_smooth.
     """
+    talib = pytest.importorskip('talib')
+    
     # Extract data
-    open_data = test_ohlcv_data['open']
     high_data = test_ohlcv_data['high']
     low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
@@ -34,9 +34,6 @@ def test_adl_vs_talib(test_ohlcv_data, ma_period):
     data_length = len(close_data)
     assert data_length >= 1, f"Insufficient data: {data_length} bars, need at least 1"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with pyita (without smoothing first, to compare base ADL)
     adl_result = ta.adl(quotes, ma_period=None)
     
@@ -51,26 +48,19 @@ def test_adl_vs_talib(test_ohlcv_data, ma_period):
 
 
 @pytest.mark.parametrize('ma_period', [2, 14])
-def test_adl_smooth(test_ohlcv_data, ma_period):
+def test_adl_smooth(test_ohlcv_data, quotes, ma_period):
     """Test ADL with smoothing.
     
     This test verifies that adl_smooth is calculated correctly when ma_period is provided.
     Note: We don't compare with TA-Lib here because TA-Lib doesn't provide smoothed ADL directly.
     """
     # Extract data
-    open_data = test_ohlcv_data['open']
-    high_data = test_ohlcv_data['high']
-    low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
-    volume_data = test_ohlcv_data['volume']
     
     # Check minimum data requirement for smoothing
     data_length = len(close_data)
     assert data_length >= ma_period, f"Insufficient data: {data_length} bars, need at least {ma_period}"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with pyita (with smoothing)
     adl_result = ta.adl(quotes, ma_period=ma_period, ma_type='sma')
     
@@ -7,17 +7,8 @@ from stock_indicators_helpers import get_si_ref
 
 
 @pytest.mark.parametrize('period', [14, 2])
-def test_adx_vs_si(test_ohlcv_data, period):
+def test_adx_vs_si(quotes, period):
     """Test ADX calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     adx_result = ta.adx(quotes, period=period, smooth=period)
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_adx', period)
@@ -28,17 +19,8 @@ def test_adx_vs_si(test_ohlcv_data, period):
 
 
 @pytest.mark.parametrize('period', [14, 2])
-def test_plus_di_vs_si(test_ohlcv_data, period):
+def test_plus_di_vs_si(quotes, period):
     """Test Plus DI calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     adx_result = ta.adx(quotes, period=period, smooth=period)
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_adx', period)
@@ -49,17 +31,8 @@ def test_plus_di_vs_si(test_ohlcv_data, period):
 
 
 @pytest.mark.parametrize('period', [14, 2])
-def test_minus_di_vs_si(test_ohlcv_data, period):
+def test_minus_di_vs_si(quotes, period):
     """Test Minus DI calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     adx_result = ta.adx(quotes, period=period, smooth=period)
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_adx', period)
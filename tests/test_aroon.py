@@ -7,17 +7,8 @@ from stock_indicators_helpers import get_si_ref
 
 
 @pytest.mark.parametrize('period', [2, 7, 14])
-def test_aroon_vs_si(test_ohlcv_data, period):
+def test_aroon_vs_si(quotes, period):
     """Test Aroon calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     aroon_result = ta.aroon(quotes, period=period)
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_aroon', period)
@@ -32,17 +23,8 @@ def test_aroon_vs_si(test_ohlcv_data, period):
 
 
 @pytest.mark.parametrize('period', [2, 7, 14])
-def test_aroon_oscillator_vs_si(test_ohlcv_data, period):
+def test_aroon_oscillator_vs_si(quotes, period):
     """Test Aroon Oscillator calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     aroon_result = ta.aroon(quotes, period=period)
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_aroon', period)
@@ -7,17 +7,8 @@ from stock_indicators_helpers import get_si_ref
 
 
 @pytest.mark.parametrize('smooth', [2, 14])
-def test_atr_vs_si(test_ohlcv_data, smooth):
+def test_atr_vs_si(quotes, smooth):
     """Test ATR calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     atr_result = ta.atr(quotes, smooth=smooth, ma_type='mma')
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_atr', smooth)
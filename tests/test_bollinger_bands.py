@@ -2,10 +2,11 @@
 import numpy as np
 import pytest
 import pyita as ta
-import talib
 
 from conftest import arrays_equal_with_nan
 
+talib = pytest.importorskip('talib')
+
 
 @pytest.mark.parametrize('period, deviation', [
     (200, 3),
@@ -15,12 +16,12 @@ from conftest import arrays_equal_with_nan
     (20, 3),
     (4, 2),
 ])
-def test_bollinger_bands_vs_talib(test_ohlcv_data, period, deviation):
+def test_bollinger_bands_vs_talib(test_ohlcv_data, quotes, period, deviation):
     """Test Bollinger Bands calculation against TA-Lib reference implementation.
     
     This test:
     1. Loads test OHLCV data
-    2. Creates Quotes object
+    2. Uses shared Quotes object
     3. Calculates Bollinger Bands using pyita
     4. Calculates Bollinger Bands using TA-Lib
     5. Compares results with tolerance
@@ -29,19 +30,12 @@ def test_bollinger_bands_vs_talib(test_ohlcv_data, period, deviation):
     ma_type='sma' and value='close' are fixed.
     """
     # Extract data
-    open_data = test_ohlcv_data['open']
-    high_data = test_ohlcv_data['high']
-    low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
-    volume_data = test_ohlcv_data['volume']
     
     # Check minimum data requirement
     data_length = len(close_data)
     assert data_length >= period, f"Insufficient data: {data_length} bars, need at least {period}"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with pyita
     bb = ta.bollinger_bands(quotes, period=period, deviation=deviation, ma_type='sma', value='close')
     
@@ -10,17 +10,8 @@ from stock_indicators_helpers import get_si_ref
     (2, 3),
     (20, 2.5),
 ])
-def test_chandelier_vs_si(test_ohlcv_data, period, multiplier):
+def test_chandelier_vs_si(quotes, period, multiplier):
     """Test Chandelier Exit calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     chandelier_result = ta.chandelier(quotes, period=period, multiplier=multiplier, use_close=False)
 
     # Pass strings instead of enum - conversion happens inside get_si_ref only when generating data
@@ -12,13 +12,13 @@ Example:
     python download_test_data.py --source binance --symbol BTC/USDT --timeframe 1h --year 2024
 """
 import argparse
+import asyncio
 import pickle
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 import numpy as np
-import ccxt
 from tqdm import tqdm
 
 
@@ -43,60 +43,64 @@ def get_year_timestamps(year):
             - end: Current date minus one day, 23:59:59 UTC
     """
     # Start: January 1, 00:00:00 UTC
-    start = datetime(year, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-    start_ms = int(start.timestamp() * 1000)
+    start_ms = int(np.datetime64(f'{year}-01-01', 'ms').astype(np.int64))
     
-    # End: Current date minus one day, 23:59:59 UTC
-    end_date = datetime.now(timezone.utc).replace(hour=23, minute=59, second=59, microsecond=999000)
-    end_date = end_date.replace(day=end_date.day - 1)
-    end_ms = int(end_date.timestamp() * 1000)
+    # End: Current date minus one day, 23:59:59.999 UTC (numpy datetimes are UTC),
+    # i.e. one millisecond before today's midnight
+    today = np.datetime64('now', 'D')
+    end_ms = int(today.astype('datetime64[ms]').astype(np.int64)) - 1
     
     return start_ms, end_ms
 
 
-def fetch_ohlcv_batch(exchange, symbol, timeframe, since, limit=500):
+async def fetch_ohlcv_batch(exchange, symbol, timeframe, since, limit=500):
     """Fetch a batch of OHLCV data.
     
     Args:
-        exchange: CCXT exchange instance
+        exchange: CCXT async exchange instance
         symbol: Trading pair (e.g., 'BTC/USDT')
         timeframe: Timeframe (e.g., '1h')
         since: Start timestamp in milliseconds
         limit: Maximum number of bars to fetch (default: 500)
         
     Returns:
-        list: List of OHLCV bars [[timestamp, open, high, low, close, volume], ...]
+        numpy.ndarray: OHLCV bars [[timestamp, open, high, low, close, volume], ...],
+            shape (n_bars, 6), float64
     """
     try:
-        ohlcv = exchange.fetch_ohlcv(symbol, timeframe, since, limit)
-        return ohlcv
+        ohlcv = await exchange.fetch_ohlcv(symbol, timeframe, since, limit)
+        return np.asarray(ohlcv, dtype=float).reshape(-1, 6)
     except Exception as e:
         print(f"Error fetching data: {e}", file=sys.stderr)
         raise
 
 
-def download_ohlcv_data(exchange, symbol, timeframe, start_ms, end_ms, limit=500):
-    """Download OHLCV data in batches.
+async def download_ohlcv_data(exchange, symbol, timeframe, start_ms, end_ms, limit=500, concurrency=8):
+    """Download OHLCV data in concurrent batches.
+    
+    The date range is split into windows of `limit` bars each, which are
+    fetched concurrently (at most `concurrency` requests at a time, on top of
+    the exchange rate limit).
     
     Args:
-        exchange: CCXT exchange instance
+        exchange: CCXT async exchange instance
         symbol: Trading pair
         timeframe: Timeframe
         start_ms: Start timestamp in milliseconds
         end_ms: End timestamp in milliseconds
         limit: Number of bars per batch (default: 500)
+        concurrency: Maximum number of simultaneous requests (default: 8)
         
     Returns:
-        list: Complete list of OHLCV bars
+        numpy.ndarray: OHLCV bars sorted by time, shape (n_bars, 6), float64
     """
-    all_bars = []
-    current_since = start_ms
+    timeframe_ms = exchange.parse_timeframe(timeframe) * 1000
+    window_starts = range(start_ms, end_ms + 1, timeframe_ms * limit)
     
-    # Estimate total number of bars for progress bar
-    # Approximate: (end_ms - start_ms) / (timeframe_ms * limit)
-    timeframe_hours = {'1h': 1, '4h': 4, '1d': 24, '1w': 168}.get(timeframe, 1)
-    timeframe_ms = timeframe_hours * 60 * 60 * 1000
-    estimated_batches = max(1, int((end_ms - start_ms) / (timeframe_ms * limit)) + 1)
+    # Each window is written into its own slot of a preallocated buffer,
+    # rows not filled by the exchange stay NaN
+    all_bars = np.full((len(window_starts) * limit, 6), np.nan)
+    semaphore = asyncio.Semaphore(concurrency)
     
     print(f"Starting download...")
     print(f"  Source: {exchange.id}")
@@ -106,31 +110,26 @@ def download_ohlcv_data(exchange, symbol, timeframe, start_ms, end_ms, limit=500
           f"to {datetime.fromtimestamp(end_ms/1000, tz=timezone.utc).date()}")
     print()
     
-    with tqdm(total=estimated_batches, desc="Downloading", unit="batch") as pbar:
-        while current_since < end_ms:
-            batch = fetch_ohlcv_batch(exchange, symbol, timeframe, current_since, limit)
-            
-            if not batch:
-                break
-            
-            all_bars.extend(batch)
-            
-            # Update progress
+    with tqdm(total=len(window_starts), desc="Downloading", unit="batch") as pbar:
+        
+        async def fetch_window(window_index, since):
+            async with semaphore:
+                batch = await fetch_ohlcv_batch(exchange, symbol, timeframe, since, limit)
+            batch = batch[:limit]
+            slot_start = window_index * limit
+            all_bars[slot_start:slot_start + len(batch)] = batch
             pbar.update(1)
-            
-            # Check if we've reached the end
-            last_timestamp = batch[-1][0]
-            if last_timestamp >= end_ms:
-                break
-            
-            # Next batch starts from the last timestamp + 1ms
-            current_since = last_timestamp + 1
-            
-            # Safety check: if we got fewer bars than requested, we're done
-            if len(batch) < limit:
-                break
-    
-    return all_bars
+        
+        await asyncio.gather(*(
+            fetch_window(window_index, since) for window_index, since in enumerate(window_starts)
+        ))
+    
+    timestamps = all_bars[:, 0]
+    all_bars = all_bars[(timestamps >= start_ms) & (timestamps <= end_ms)]
+    
+    # If the exchange has gaps, a batch runs into the next window: drop duplicates and sort
+    _, unique_index = np.unique(all_bars[:, 0], return_index=True)
+    return all_bars[unique_index]
 
 
 def generate_filename(source, symbol, timeframe, year):
@@ -207,11 +206,14 @@ def initialize_exchange(source):
         source: Exchange name (e.g., 'binance')
         
     Returns:
-        ccxt.Exchange: Initialized exchange instance
+        ccxt.async_support.Exchange: Initialized async exchange instance
         
     Raises:
         SystemExit: If exchange cannot be initialized
     """
+    # Imported here: ccxt is large and only needed once the download starts
+    import ccxt.async_support as ccxt
+    
     try:
         exchange_class = getattr(ccxt, source)
         exchange = exchange_class({
@@ -236,7 +238,8 @@ def save_data(bars, source, symbol, timeframe, year):
     - volume: float array
     
     Args:
-        bars: List of OHLCV bars [[timestamp_ms, open, high, low, close, volume], ...]
+        bars: OHLCV bars [[timestamp_ms, open, high, low, close, volume], ...],
+            list or numpy array of shape (n_bars, 6)
         source: Exchange name
         symbol: Trading pair
         timeframe: Timeframe
@@ -245,16 +248,19 @@ def save_data(bars, source, symbol, timeframe, year):
     Raises:
         SystemExit: If data cannot be saved
     """
-    # Convert to numpy arrays
+    # Convert to numpy arrays in one pass
     # bars format: [[timestamp_ms, open, high, low, close, volume], ...]
-    timestamps_ms = np.array([bar[0] for bar in bars], dtype=np.int64)
-    time = timestamps_ms.astype('datetime64[ms]')
+    # Millisecond timestamps are below 2**53, so they are exact in float64
+    bars_array = np.asarray(bars, dtype=float)
+    
+    time = bars_array[:, 0].astype(np.int64).astype('datetime64[ms]')
     
-    open_data = np.array([bar[1] for bar in bars], dtype=float)
-    high_data = np.array([bar[2] for bar in bars], dtype=float)
-    low_data = np.array([bar[3] for bar in bars], dtype=float)
-    close_data = np.array([bar[4] for bar in bars], dtype=float)
-    volume_data = np.array([bar[5] for bar in bars], dtype=float)
+    # Columns of the 2D array are strided views, store contiguous copies
+    open_data = np.ascontiguousarray(bars_array[:, 1])
+    high_data = np.ascontiguousarray(bars_array[:, 2])
+    low_data = np.ascontiguousarray(bars_array[:, 3])
+    close_data = np.ascontiguousarray(bars_array[:, 4])
+    volume_data = np.ascontiguousarray(bars_array[:, 5])
     
     # Create dictionary with numpy arrays
     data_dict = {
@@ -294,6 +300,31 @@ def save_data(bars, source, symbol, timeframe, year):
         sys.exit(1)
 
 
+async def download(args, start_ms, end_ms):
+    """Initialize exchange and download OHLCV data.
+    
+    Args:
+        args: Parsed command line arguments
+        start_ms: Start timestamp in milliseconds
+        end_ms: End timestamp in milliseconds
+        
+    Returns:
+        numpy.ndarray: OHLCV bars, shape (n_bars, 6), float64
+    """
+    exchange = initialize_exchange(args.source)
+    try:
+        return await download_ohlcv_data(
+            exchange,
+            args.symbol,
+            args.timeframe,
+            start_ms,
+            end_ms,
+            limit=500
+        )
+    finally:
+        await exchange.close()
+
+
 def main():
     """Main function."""
     # Parse arguments
@@ -303,27 +334,17 @@ def main():
     if args.year is None:
         args.year = get_previous_year()
     
-    # Initialize exchange
-    exchange = initialize_exchange(args.source)
-    
     # Get timestamps
     start_ms, end_ms = get_year_timestamps(args.year)
     
     # Download data
     try:
-        bars = download_ohlcv_data(
-            exchange,
-            args.symbol,
-            args.timeframe,
-            start_ms,
-            end_ms,
-            limit=500
-        )
+        bars = asyncio.run(download(args, start_ms, end_ms))
     except Exception as e:
         print(f"Error downloading data: {e}", file=sys.stderr)
         sys.exit(1)
     
-    if not bars:
+    if len(bars) == 0:
         print("Error: No data downloaded", file=sys.stderr)
         sys.exit(1)
     
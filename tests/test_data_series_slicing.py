@@ -6,119 +6,89 @@ import pyita as ta
 from pyita.exceptions import PyTAExceptionDataSeriesNonFound
 from pyita.indicator_result import IndicatorResult
 
+SAMPLE_OPEN = np.arange(100.0, 110.0)
+SAMPLE_HIGH = np.arange(105.0, 115.0)
+SAMPLE_LOW = np.arange(99.0, 109.0)
+SAMPLE_CLOSE = np.arange(102.0, 112.0)
+SAMPLE_VOLUME = np.arange(1000, 2000, 100)
 
-@pytest.fixture
+SAMPLE_EMA = np.arange(100.0, 105.0)
+SAMPLE_SMA = np.arange(100.5, 105.5)
+SAMPLE_RSI = np.arange(50.0, 55.0)
+
+
+@pytest.fixture(scope="module")
 def sample_quotes():
-    """Create sample Quotes object for testing."""
-    return ta.Quotes(
-        open=np.array([100.0, 101.0, 102.0, 103.0, 104.0, 105.0, 106.0, 107.0, 108.0, 109.0]),
-        high=np.array([105.0, 106.0, 107.0, 108.0, 109.0, 110.0, 111.0, 112.0, 113.0, 114.0]),
-        low=np.array([99.0, 100.0, 101.0, 102.0, 103.0, 104.0, 105.0, 106.0, 107.0, 108.0]),
-        close=np.array([102.0, 103.0, 104.0, 105.0, 106.0, 107.0, 108.0, 109.0, 110.0, 111.0]),
-        volume=np.array([1000, 1100, 1200, 1300, 1400, 1500, 1600, 1700, 1800, 1900]),
+    """Create sample Quotes object for testing.
+    
+    Shared by the module tests, which only read it, so it is read-only.
+    """
+    quotes = ta.Quotes(
+        open=SAMPLE_OPEN.copy(),
+        high=SAMPLE_HIGH.copy(),
+        low=SAMPLE_LOW.copy(),
+        close=SAMPLE_CLOSE.copy(),
+        volume=SAMPLE_VOLUME.copy(),
     )
+    quotes.writeable = False
+    return quotes
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_result():
-    """Create sample IndicatorResult object for testing."""
-    return IndicatorResult({
-        'ema': np.array([100.0, 101.0, 102.0, 103.0, 104.0]),
-        'sma': np.array([100.5, 101.5, 102.5, 103.5, 104.5]),
-        'rsi': np.array([50.0, 51.0, 52.0, 53.0, 54.0]),
+    """Create sample IndicatorResult object for testing.
+    
+    Shared by the module tests, which only read it, so it is read-only.
+    """
+    result = IndicatorResult({
+        'ema': SAMPLE_EMA.copy(),
+        'sma': SAMPLE_SMA.copy(),
+        'rsi': SAMPLE_RSI.copy(),
     })
+    result.writeable = False
+    return result
 
 
 class TestQuotesSlicing:
     """Tests for Quotes slicing with slice objects."""
     
-    def test_simple_slice(self, sample_quotes):
-        """Test simple slice quotes[1:10]."""
-        sliced = sample_quotes[1:10]
-        
-        assert isinstance(sliced, ta.Quotes)
-        assert len(sliced.close) == 9
-        np.testing.assert_array_equal(sliced.close, sample_quotes.close[1:10])
-        np.testing.assert_array_equal(sliced.open, sample_quotes.open[1:10])
-        np.testing.assert_array_equal(sliced.volume, sample_quotes.volume[1:10])
-    
-    def test_slice_from_start(self, sample_quotes):
-        """Test slice quotes[:10]."""
-        sliced = sample_quotes[:10]
-        
-        assert isinstance(sliced, ta.Quotes)
-        assert len(sliced.close) == 10
-        np.testing.assert_array_equal(sliced.close, sample_quotes.close[:10])
-    
-    def test_slice_to_end(self, sample_quotes):
-        """Test slice quotes[5:]."""
-        sliced = sample_quotes[5:]
-        
-        assert isinstance(sliced, ta.Quotes)
-        assert len(sliced.close) == 5
-        np.testing.assert_array_equal(sliced.close, sample_quotes.close[5:])
-    
-    def test_slice_with_step(self, sample_quotes):
-        """Test slice quotes[::2]."""
-        sliced = sample_quotes[::2]
-        
-        assert isinstance(sliced, ta.Quotes)
-        assert len(sliced.close) == 5
-        np.testing.assert_array_equal(sliced.close, sample_quotes.close[::2])
-    
-    def test_slice_with_start_end_step(self, sample_quotes):
-        """Test slice quotes[1:10:2]."""
-        sliced = sample_quotes[1:10:2]
+    @pytest.mark.parametrize('key, expected_length', [
+        (slice(1, 10), 9),
+        (slice(None, 10), 10),
+        (slice(5, None), 5),
+        (slice(None, None, 2), 5),
+        (slice(1, 10, 2), 5),
+        (slice(None), 10),
+    ], ids=['1:10', ':10', '5:', '::2', '1:10:2', ':'])
+    def test_slice(self, sample_quotes, key, expected_length):
+        """Test quotes[key] slices every column."""
+        sliced = sample_quotes[key]
         
         assert isinstance(sliced, ta.Quotes)
-        assert len(sliced.close) == 5
-        np.testing.assert_array_equal(sliced.close, sample_quotes.close[1:10:2])
+        assert len(sliced.close) == expected_length
+        for column in ('open', 'high', 'low', 'close', 'volume'):
+            np.testing.assert_array_equal(sliced[column], sample_quotes[column][key])
+            if expected_length:
+                assert np.shares_memory(sliced[column], sample_quotes[column]), f"{column} is not a view"
     
-    def test_full_slice(self, sample_quotes):
-        """Test slice quotes[:]."""
-        sliced = sample_quotes[:]
-        
-        assert isinstance(sliced, ta.Quotes)
-        assert len(sliced.close) == len(sample_quotes.close)
-        np.testing.assert_array_equal(sliced.close, sample_quotes.close)
-        assert sliced is not sample_quotes
+    def test_full_slice_is_new_object(self, sample_quotes):
+        """Test quotes[:] returns a new Quotes object."""
+        assert sample_quotes[:] is not sample_quotes
 
 
 class TestQuotesIndexing:
     """Tests for Quotes indexing with int."""
     
-    def test_first_index(self, sample_quotes):
-        """Test quotes[0]."""
-        sliced = sample_quotes[0]
-        
-        assert isinstance(sliced, ta.Quotes)
-        assert len(sliced.close) == 1
-        assert sliced.close[0] == sample_quotes.close[0]
-        assert sliced.open[0] == sample_quotes.open[0]
-    
-    def test_middle_index(self, sample_quotes):
-        """Test quotes[5]."""
-        sliced = sample_quotes[5]
-        
-        assert isinstance(sliced, ta.Quotes)
-        assert len(sliced.close) == 1
-        assert sliced.close[0] == sample_quotes.close[5]
-    
-    def test_negative_index(self, sample_quotes):
-        """Test quotes[-1]."""
-        sliced = sample_quotes[-1]
-        
-        assert isinstance(sliced, ta.Quotes)
-        assert len(sliced.close) == 1
-        assert sliced.close[0] == sample_quotes.close[-1]
-    
-    def test_negative_middle_index(self, sample_quotes):
-        """Test quotes[-5]."""
-        sliced = sample_quotes[-5]
+    @pytest.mark.parametrize('index', [0, 5, -1, -5])
+    def test_index(self, sample_quotes, index):
+        """Test quotes[index] returns one-bar Quotes."""
+        sliced = sample_quotes[index]
         
         assert isinstance(sliced, ta.Quotes)
         assert len(sliced.close) == 1
-        assert sliced.close[0] == sample_quotes.close[-5]
+        for column in ('open', 'high', 'low', 'close', 'volume'):
+            assert sliced[column][0] == sample_quotes[column][index]
+            assert np.shares_memory(sliced[column], sample_quotes[column]), f"{column} is not a view"
 
 
 class TestQuotesIndexErrors:
@@ -225,6 +195,7 @@ class TestIndicatorResultSlicing:
         assert len(sliced.ema) == 3
         np.testing.assert_array_equal(sliced.ema, sample_result.ema[1:4])
         np.testing.assert_array_equal(sliced.sma, sample_result.sma[1:4])
+        assert np.shares_memory(sliced.ema, sample_result.ema)
     
     def test_result_index(self, sample_result):
         """Test result[2]."""
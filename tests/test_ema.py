@@ -3,16 +3,16 @@ import numpy as np
 import pytest
 import pyita as ta
 
-from conftest import arrays_equal_with_nan
+from conftest import arrays_equal_with_nan, first_non_nan_index
 
 
 @pytest.mark.parametrize('period', [1, 3, 5, 22])
-def test_ema_direct_calculation(test_ohlcv_data, period):
+def test_ema_direct_calculation(test_ohlcv_data, quotes, period):
     """Test EMA calculation by direct computation.
     
     This test:
     1. Loads test OHLCV data
-    2. Creates Quotes object
+    2. Uses shared Quotes object
     3. Calculates EMA using pyita
     4. Verifies that EMA values match direct calculation:
        - alpha = 2.0 / (period + 1)
@@ -23,19 +23,12 @@ def test_ema_direct_calculation(test_ohlcv_data, period):
     value='close' is fixed.
     """
     # Extract data
-    open_data = test_ohlcv_data['open']
-    high_data = test_ohlcv_data['high']
-    low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
-    volume_data = test_ohlcv_data['volume']
     
     # Check minimum data requirement
     data_length = len(close_data)
     assert data_length >= period, f"Insufficient data: {data_length} bars, need at least {period}"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with pyita
     ema_result = ta.ema(quotes, period=period, value='close')
     
@@ -47,11 +40,7 @@ def test_ema_direct_calculation(test_ohlcv_data, period):
     alpha_n = 1.0 - alpha
     
     # Find first non-NaN value
-    start = 0
-    for i, value in enumerate(values):
-        if not np.isnan(value):
-            start = i
-            break
+    start = first_non_nan_index(values)
     
     # Check we have enough data
     assert len(values) >= start + period, f"Insufficient data after skipping NaNs"
@@ -10,17 +10,8 @@ from stock_indicators_helpers import get_si_ref
     (9, 26, 52, 26, 26),
     (9, 26, 52, 25, 27),
 ])
-def test_ichimoku_vs_si(test_ohlcv_data, period_short, period_mid, period_long, offset_senkou, offset_chikou):
+def test_ichimoku_vs_si(quotes, period_short, period_mid, period_long, offset_senkou, offset_chikou):
     """Test Ichimoku calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     ichimoku_result = ta.ichimoku(
         quotes,
         period_short=period_short,
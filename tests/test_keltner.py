@@ -11,17 +11,8 @@ from stock_indicators_helpers import get_si_ref
     (5, 2, 5),
     (10, 3, 7),
 ])
-def test_keltner_vs_si(test_ohlcv_data, period, multiplier, period_atr):
+def test_keltner_vs_si(quotes, period, multiplier, period_atr):
     """Test Keltner Channel calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     keltner_result = ta.keltner(
         quotes,
         period=period,
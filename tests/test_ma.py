@@ -2,28 +2,46 @@
 import numpy as np
 import pytest
 import pyita as ta
-import talib
 
-from conftest import arrays_equal_with_nan
+from conftest import arrays_equal_with_nan, first_non_nan_index
+
+
+def ema_scipy_calculate(source_values, alpha, first_value=np.nan, start=0):
+    """Calculate EMA with scipy.signal.lfilter (requires scipy).
+    
+    Same semantics as pyita.move_average.ema_calculate, but the recurrence runs
+    as a first-order IIR filter in scipy's compiled code. Serves as an
+    independent reference for the numba kernel.
+    """
+    from scipy.signal import lfilter
+
+    if np.isnan(first_value):
+        first_index = first_non_nan_index(source_values)
+        if first_index < len(source_values):
+            start = first_index
+        first_value = source_values[start]
+
+    result = np.empty(len(source_values), dtype=float)
+    result[: start] = np.nan
+    result[start] = first_value
+
+    if start + 1 < len(source_values):
+        alpha_n = 1.0 - alpha
+        result[start + 1:] = lfilter([alpha], [1.0, -alpha_n], source_values[start + 1:], zi=[first_value * alpha_n])[0]
+
+    return result
 
 
 @pytest.mark.parametrize('period', [1, 2, 5, 8, 10, 22])
-def test_ma_sma_vs_sma_indicator(test_ohlcv_data, period):
+def test_ma_sma_vs_sma_indicator(test_ohlcv_data, quotes, period):
     """Test MA with ma_type='sma' against ta.sma indicator."""
     # Extract data
-    open_data = test_ohlcv_data['open']
-    high_data = test_ohlcv_data['high']
-    low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
-    volume_data = test_ohlcv_data['volume']
     
     # Check minimum data requirement
     data_length = len(close_data)
     assert data_length >= period, f"Insufficient data: {data_length} bars, need at least {period}"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with MA
     ma_result = ta.ma(quotes, period=period, value='close', ma_type='sma')
     
@@ -38,22 +56,15 @@ def test_ma_sma_vs_sma_indicator(test_ohlcv_data, period):
 
 
 @pytest.mark.parametrize('period', [1, 2, 5, 8, 10, 22])
-def test_ma_ema_vs_ema_indicator(test_ohlcv_data, period):
+def test_ma_ema_vs_ema_indicator(test_ohlcv_data, quotes, period):
     """Test MA with ma_type='ema' against ta.ema indicator."""
     # Extract data
-    open_data = test_ohlcv_data['open']
-    high_data = test_ohlcv_data['high']
-    low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
-    volume_data = test_ohlcv_data['volume']
     
     # Check minimum data requirement
     data_length = len(close_data)
     assert data_length >= period, f"Insufficient data: {data_length} bars, need at least {period}"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with MA
     ma_result = ta.ma(quotes, period=period, value='close', ma_type='ema')
     
@@ -68,22 +79,15 @@ def test_ma_ema_vs_ema_indicator(test_ohlcv_data, period):
 
 
 @pytest.mark.parametrize('period', [1, 2, 5, 8, 10, 22])
-def test_ma_ema_direct_calculation(test_ohlcv_data, period):
+def test_ma_ema_direct_calculation(test_ohlcv_data, quotes, period):
     """Test MA with ma_type='ema' by direct calculation."""
     # Extract data
-    open_data = test_ohlcv_data['open']
-    high_data = test_ohlcv_data['high']
-    low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
-    volume_data = test_ohlcv_data['volume']
     
     # Check minimum data requirement
     data_length = len(close_data)
     assert data_length >= period, f"Insufficient data: {data_length} bars, need at least {period}"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with MA
     ma_result = ta.ma(quotes, period=period, value='close', ma_type='ema')
     
@@ -94,11 +98,7 @@ def test_ma_ema_direct_calculation(test_ohlcv_data, period):
     
     if len(source_values) >= period:
         # Find first non-NaN value
-        start_idx = 0
-        for i, val in enumerate(source_values):
-            if not np.isnan(val):
-                start_idx = i
-                break
+        start_idx = first_non_nan_index(source_values)
         
         # Calculate initial SMA (first period elements starting from start_idx)
         if start_idx + period <= len(source_values):
@@ -123,22 +123,15 @@ def test_ma_ema_direct_calculation(test_ohlcv_data, period):
 
 
 @pytest.mark.parametrize('period', [1, 2, 5, 8, 10, 22])
-def test_ma_mma0_direct_calculation(test_ohlcv_data, period):
+def test_ma_mma0_direct_calculation(test_ohlcv_data, quotes, period):
     """Test MA with ma_type='mma0' by direct calculation."""
     # Extract data
-    open_data = test_ohlcv_data['open']
-    high_data = test_ohlcv_data['high']
-    low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
-    volume_data = test_ohlcv_data['volume']
     
     # Check minimum data requirement
     data_length = len(close_data)
     assert data_length >= period, f"Insufficient data: {data_length} bars, need at least {period}"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with MA
     ma_result = ta.ma(quotes, period=period, value='close', ma_type='mma0')
     
@@ -149,13 +142,7 @@ def test_ma_mma0_direct_calculation(test_ohlcv_data, period):
     # MMA0 initialization: first value is first data element
     if len(source_values) > 0:
         # Find first non-NaN value
-        start_idx = 0
-        for i, val in enumerate(source_values):
-            if not np.isnan(val):
-                start_idx = i
-                break
-        else:
-            start_idx = len(source_values)
+        start_idx = first_non_nan_index(source_values)
         
         if start_idx < len(source_values):
             # Initialize with first value
@@ -178,22 +165,15 @@ def test_ma_mma0_direct_calculation(test_ohlcv_data, period):
 
 
 @pytest.mark.parametrize('period', [1, 2, 5, 8, 10, 22])
-def test_ma_ema0_direct_calculation(test_ohlcv_data, period):
+def test_ma_ema0_direct_calculation(test_ohlcv_data, quotes, period):
     """Test MA with ma_type='ema0' by direct calculation."""
     # Extract data
-    open_data = test_ohlcv_data['open']
-    high_data = test_ohlcv_data['high']
-    low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
-    volume_data = test_ohlcv_data['volume']
     
     # Check minimum data requirement
     data_length = len(close_data)
     assert data_length >= period, f"Insufficient data: {data_length} bars, need at least {period}"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with MA
     ma_result = ta.ma(quotes, period=period, value='close', ma_type='ema0')
     
@@ -204,13 +184,7 @@ def test_ma_ema0_direct_calculation(test_ohlcv_data, period):
     # EMA0 initialization: first value is first data element
     if len(source_values) > 0:
         # Find first non-NaN value
-        start_idx = 0
-        for i, val in enumerate(source_values):
-            if not np.isnan(val):
-                start_idx = i
-                break
-        else:
-            start_idx = len(source_values)
+        start_idx = first_non_nan_index(source_values)
         
         if start_idx < len(source_values):
             # Initialize with first value
@@ -233,22 +207,15 @@ def test_ma_ema0_direct_calculation(test_ohlcv_data, period):
 
 
 @pytest.mark.parametrize('period', [1, 2, 5, 8, 10, 22])
-def test_ma_mma_direct_calculation(test_ohlcv_data, period):
+def test_ma_mma_direct_calculation(test_ohlcv_data, quotes, period):
     """Test MA with ma_type='mma' by direct calculation."""
     # Extract data
-    open_data = test_ohlcv_data['open']
-    high_data = test_ohlcv_data['high']
-    low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
-    volume_data = test_ohlcv_data['volume']
     
     # Check minimum data requirement
     data_length = len(close_data)
     assert data_length >= period, f"Insufficient data: {data_length} bars, need at least {period}"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with MA
     ma_result = ta.ma(quotes, period=period, value='close', ma_type='mma')
     
@@ -259,11 +226,7 @@ def test_ma_mma_direct_calculation(test_ohlcv_data, period):
     
     if len(source_values) >= period:
         # Find first non-NaN value
-        start_idx = 0
-        for i, val in enumerate(source_values):
-            if not np.isnan(val):
-                start_idx = i
-                break
+        start_idx = first_non_nan_index(source_values)
         
         # Calculate initial SMA (first period elements starting from start_idx)
         if start_idx + period <= len(source_values):
@@ -288,12 +251,12 @@ def test_ma_mma_direct_calculation(test_ohlcv_data, period):
 
 
 @pytest.mark.parametrize('period', [2, 5, 8, 10, 22])
-def test_ma_emaw_vs_talib(test_ohlcv_data, period):
+def test_ma_emaw_vs_talib(test_ohlcv_data, quotes, period):
     """Test MA with ma_type='emaw' against TA-Lib EMA.
     
     This test:
     1. Loads test OHLCV data
-    2. Creates Quotes object
+    2. Uses shared Quotes object
     3. Calculates EMA with warm-up using pyita (ma_type='emaw')
     4. Calculates EMA using TA-Lib (which uses warm-up method)
     5. Compares results
@@ -301,20 +264,15 @@ def test_ma_emaw_vs_talib(test_ohlcv_data, period):
     Parameters are parametrized: period.
     value='close' is fixed.
     """
+    talib = pytest.importorskip('talib')
+    
     # Extract data
-    open_data = test_ohlcv_data['open']
-    high_data = test_ohlcv_data['high']
-    low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
-    volume_data = test_ohlcv_data['volume']
     
     # Check minimum data requirement
     data_length = len(close_data)
     assert data_length >= period, f"Insufficient data: {data_length} bars, need at least {period}"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with pyita
     ma_result = ta.ma(quotes, period=period, value='close', ma_type='emaw')
     
@@ -327,3 +285,62 @@ def test_ma_emaw_vs_talib(test_ohlcv_data, period):
         talib_ema
     ), f"MA (ma_type='emaw', period={period}) does not match TA-Lib EMA"
 
+
+
+@pytest.mark.parametrize('period', [1, 2, 5, 22])
+def test_ema_scipy_vs_ema_calculate(test_ohlcv_data, period):
+    """Test scipy lfilter EMA against numba ema_calculate."""
+    pytest.importorskip('scipy')
+    from pyita.move_average import ema_calculate
+
+    close_data = test_ohlcv_data['close'].copy()
+    close_data[:3] = np.nan
+    alpha = 2.0 / (period + 1)
+
+    assert arrays_equal_with_nan(
+        ema_scipy_calculate(close_data, alpha), ema_calculate(close_data, alpha)
+    ), f"scipy EMA (period={period}) does not match ema_calculate"
+
+    first_value = close_data[3: 3 + period].sum() / period
+    assert arrays_equal_with_nan(
+        ema_scipy_calculate(close_data, alpha, first_value, 2 + period),
+        ema_calculate(close_data, alpha, first_value, 2 + period)
+    ), f"scipy EMA with initial value (period={period}) does not match ema_calculate"
+
+
+@pytest.mark.parametrize('period', [2, 10, 11, 22, 200])
+def test_sma_calculate_with_nan(test_ohlcv_data, period):
+    """Test sma_calculate on data with NaN values against direct window means."""
+    from pyita.move_average import sma_calculate
+
+    values = test_ohlcv_data['close'].copy()
+    values[:5] = np.nan
+    values[1000] = np.nan
+
+    expected_sma = np.full(len(values), np.nan, dtype=np.float64)
+    for i in range(period - 1, len(values)):
+        expected_sma[i] = values[i - period + 1: i + 1].mean()
+
+    assert arrays_equal_with_nan(
+        sma_calculate(values, period), expected_sma
+    ), f"sma_calculate with NaN values (period={period}) does not match direct calculation"
+
+
+@pytest.mark.parametrize('period', [2, 10, 11, 22, 200])
+def test_sma_calculate_with_inf(test_ohlcv_data, period):
+    """Test that infinite values only affect sma_calculate windows containing them."""
+    from pyita.move_average import sma_calculate
+
+    values = test_ohlcv_data['close'].copy()
+    values[500] = np.inf
+    values[3000] = np.inf
+    values[3001] = -np.inf
+
+    expected_sma = np.full(len(values), np.nan, dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        for i in range(period - 1, len(values)):
+            expected_sma[i] = values[i - period + 1: i + 1].mean()
+
+    assert arrays_equal_with_nan(
+        sma_calculate(values, period), expected_sma
+    ), f"sma_calculate with inf values (period={period}) does not match direct calculation"
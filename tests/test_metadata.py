@@ -1,4 +1,7 @@
 """Tests for metadata functionality."""
+import subprocess
+import sys
+
 import pytest
 
 import pyita as ta
@@ -33,6 +36,19 @@ class TestMetadata:
                 assert series['type'] in ('price', 'as_source', 'none'), \
                     f"Invalid series type '{series['type']}' for {indicator_name}.{series['name']}"
 
+    def test_metadata_cached(self):
+        """Test that metadata() and list() reuse parsed data between calls."""
+        assert ta.metadata() is ta.metadata()
+        assert ta.list() is ta.list()
+
+    def test_metadata_does_not_import_numba(self):
+        """Test that metadata access does not pay for importing numba."""
+        code = (
+            'import sys, pyita; pyita.metadata(); pyita.list(); '
+            'assert "numba" not in sys.modules, "numba was imported"'
+        )
+        subprocess.run([sys.executable, '-c', code], check=True)
+
     def test_version(self):
         """Test that __version__ is accessible and is a valid version string."""
         assert hasattr(ta, '__version__')
@@ -1,4 +1,5 @@
 """Tests for Quotes class."""
+import functools
 import pickle
 from datetime import date, datetime
 from pathlib import Path
@@ -22,62 +23,56 @@ TEST_DATA_1H_FILENAME = "BINANCE_BTC_USDT_1h_2025.pkl"
 TEST_DATA_1D_FILENAME = "BINANCE_BTC_USDT_1d_2025.pkl"
 
 
-@pytest.fixture
-def test_data_100():
-    """Load and return first 100 elements from hourly test data.
+@functools.cache
+def _load_first_100(filename):
+    """Load test data file and return read-only views of its first 100 elements.
     
+    Args:
+        filename: Name of test data pickle file in tests/test_data
+        
     Returns:
         dict: Dictionary with keys 'time', 'open', 'high', 'low', 'close', 'volume'
             containing numpy arrays of OHLCV data (100 elements)
     """
-    test_data_dir = Path(__file__).parent / "test_data"
-    filepath = test_data_dir / TEST_DATA_1H_FILENAME
+    filepath = Path(__file__).parent / "test_data" / filename
     
     assert filepath.exists(), f"Test data file not found: {filepath}"
     
     with open(filepath, 'rb') as f:
         data_dict = pickle.load(f)
     
-    # Trim to 100 elements
-    trimmed_data = {
-        'time': data_dict['time'][:100],
-        'open': data_dict['open'][:100],
-        'high': data_dict['high'][:100],
-        'low': data_dict['low'][:100],
-        'close': data_dict['close'][:100],
-        'volume': data_dict['volume'][:100],
-    }
+    # Trim to 100 elements (views, the full arrays are not copied)
+    trimmed_data = {key: data_dict[key][:100] for key in ('time', 'open', 'high', 'low', 'close', 'volume')}
+    for arr in trimmed_data.values():
+        arr.setflags(write=False)
     
     return trimmed_data
 
 
-@pytest.fixture
-def test_data_1d_100():
-    """Load and return first 100 elements from daily test data.
+@pytest.fixture(scope="session")
+def test_data_100():
+    """Load and return first 100 elements from hourly test data.
+    
+    Loaded once per session; the arrays are read-only.
     
     Returns:
         dict: Dictionary with keys 'time', 'open', 'high', 'low', 'close', 'volume'
             containing numpy arrays of OHLCV data (100 elements)
     """
-    test_data_dir = Path(__file__).parent / "test_data"
-    filepath = test_data_dir / TEST_DATA_1D_FILENAME
-    
-    assert filepath.exists(), f"Test data file not found: {filepath}"
-    
-    with open(filepath, 'rb') as f:
-        data_dict = pickle.load(f)
+    return _load_first_100(TEST_DATA_1H_FILENAME)
+
+
+@pytest.fixture(scope="session")
+def test_data_1d_100():
+    """Load and return first 100 elements from daily test data.
     
-    # Trim to 100 elements
-    trimmed_data = {
-        'time': data_dict['time'][:100],
-        'open': data_dict['open'][:100],
-        'high': data_dict['high'][:100],
-        'low': data_dict['low'][:100],
-        'close': data_dict['close'][:100],
-        'volume': data_dict['volume'][:100],
-    }
+    Loaded once per session; the arrays are read-only.
     
-    return trimmed_data
+    Returns:
+        dict: Dictionary with keys 'time', 'open', 'high', 'low', 'close', 'volume'
+            containing numpy arrays of OHLCV data (100 elements)
+    """
+    return _load_first_100(TEST_DATA_1D_FILENAME)
 
 
 def assert_quotes_equal(quotes, expected_data):
@@ -85,7 +80,7 @@ def assert_quotes_equal(quotes, expected_data):
     
     Checks:
     - Data types are correct (float for prices, datetime64[ms] for time)
-    - Values match expected data
+    - Values match expected data exactly (Quotes only casts, so no rounding is expected)
     
     Args:
         quotes: Quotes object to check
@@ -99,15 +94,15 @@ def assert_quotes_equal(quotes, expected_data):
     assert quotes.close.dtype == np.float64, "close should be float64"
     
     # Check values
-    np.testing.assert_array_almost_equal(quotes.open, expected_data['open'], decimal=10)
-    np.testing.assert_array_almost_equal(quotes.high, expected_data['high'], decimal=10)
-    np.testing.assert_array_almost_equal(quotes.low, expected_data['low'], decimal=10)
-    np.testing.assert_array_almost_equal(quotes.close, expected_data['close'], decimal=10)
+    np.testing.assert_array_equal(quotes.open, expected_data['open'])
+    np.testing.assert_array_equal(quotes.high, expected_data['high'])
+    np.testing.assert_array_equal(quotes.low, expected_data['low'])
+    np.testing.assert_array_equal(quotes.close, expected_data['close'])
     
     # Check volume if provided
     if 'volume' in expected_data:
         assert quotes.volume.dtype == np.float64, "volume should be float64"
-        np.testing.assert_array_almost_equal(quotes.volume, expected_data['volume'], decimal=10)
+        np.testing.assert_array_equal(quotes.volume, expected_data['volume'])
     else:
         assert not hasattr(quotes, 'volume') or quotes.volume is None, "volume should not be present"
     
@@ -242,7 +237,8 @@ def test_quotes_from_float_lists_datetime(test_data_100):
     volume_list = test_data_100['volume'].tolist()
     
     # Convert time to Python datetime
-    time_datetime = [ts.astype(datetime) for ts in test_data_100['time']]
+    time_datetime = test_data_100['time'].tolist()
+    assert isinstance(time_datetime[0], datetime)
     
     quotes = ta.Quotes(open_list, high_list, low_list, close_list, volume_list, time_datetime)
     
@@ -262,19 +258,20 @@ def test_quotes_from_float_lists_datetime(test_data_100):
 def test_quotes_from_int_lists_date(test_data_1d_100):
     """Test Quotes creation from int lists and Python date."""
     # Convert to int lists
-    open_list = [int(x) for x in test_data_1d_100['open']]
-    high_list = [int(x) for x in test_data_1d_100['high']]
-    low_list = [int(x) for x in test_data_1d_100['low']]
-    close_list = [int(x) for x in test_data_1d_100['close']]
-    volume_list = [int(x) for x in test_data_1d_100['volume']]
+    open_list = test_data_1d_100['open'].astype(np.int64).tolist()
+    high_list = test_data_1d_100['high'].astype(np.int64).tolist()
+    low_list = test_data_1d_100['low'].astype(np.int64).tolist()
+    close_list = test_data_1d_100['close'].astype(np.int64).tolist()
+    volume_list = test_data_1d_100['volume'].astype(np.int64).tolist()
     
     # Convert time to Python date (start of day)
-    time_date = [ts.astype('datetime64[D]').astype(date) for ts in test_data_1d_100['time']]
+    time_date = test_data_1d_100['time'].astype('datetime64[D]').tolist()
+    assert isinstance(time_date[0], date)
     
     quotes = ta.Quotes(open_list, high_list, low_list, close_list, volume_list, time_date)
     
     # Expected time should be start of day (00:00:00) in datetime64[ms]
-    expected_time = np.array([np.datetime64(d, 'ms') for d in time_date])
+    expected_time = np.array(time_date, dtype='datetime64[ms]')
     
     # Expected data: int -> float conversion (same as what Quotes does)
     expected = {
@@ -2,18 +2,17 @@
 import numpy as np
 import pytest
 import pyita as ta
-import talib
 
 from conftest import arrays_equal_with_nan
 
 
 @pytest.mark.parametrize('period', [2, 5, 10, 20, 50, 100, 300, 500])
-def test_sma_vs_talib(test_ohlcv_data, period):
+def test_sma_vs_talib(test_ohlcv_data, quotes, period):
     """Test SMA calculation against TA-Lib reference implementation.
     
     This test:
     1. Loads test OHLCV data
-    2. Creates Quotes object
+    2. Uses shared Quotes object
     3. Calculates SMA using pyita
     4. Calculates SMA using TA-Lib
     5. Compares results with tolerance
@@ -21,20 +20,15 @@ def test_sma_vs_talib(test_ohlcv_data, period):
     Parameters are parametrized: period.
     value='close' is fixed.
     """
+    talib = pytest.importorskip('talib')
+    
     # Extract data
-    open_data = test_ohlcv_data['open']
-    high_data = test_ohlcv_data['high']
-    low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
-    volume_data = test_ohlcv_data['volume']
     
     # Check minimum data requirement
     data_length = len(close_data)
     assert data_length >= period, f"Insufficient data: {data_length} bars, need at least {period}"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with pyita
     sma_result = ta.sma(quotes, period=period, value='close')
     
@@ -49,12 +43,12 @@ def test_sma_vs_talib(test_ohlcv_data, period):
 
 
 @pytest.mark.parametrize('period', [1, 3, 5, 22])
-def test_sma_direct_calculation(test_ohlcv_data, period):
+def test_sma_direct_calculation(test_ohlcv_data, quotes, period):
     """Test SMA calculation by direct computation.
     
     This test:
     1. Loads test OHLCV data
-    2. Creates Quotes object
+    2. Uses shared Quotes object
     3. Calculates SMA using pyita
     4. Verifies that SMA values match direct arithmetic mean calculation
     
@@ -62,29 +56,22 @@ def test_sma_direct_calculation(test_ohlcv_data, period):
     value='close' is fixed.
     """
     # Extract data
-    open_data = test_ohlcv_data['open']
-    high_data = test_ohlcv_data['high']
-    low_data = test_ohlcv_data['low']
     close_data = test_ohlcv_data['close']
-    volume_data = test_ohlcv_data['volume']
     
     # Check minimum data requirement
     data_length = len(close_data)
     assert data_length >= period, f"Insufficient data: {data_length} bars, need at least {period}"
     
-    # Create Quotes
-    quotes = ta.Quotes(open_data, high_data, low_data, close_data, volume_data)
-    
     # Calculate with pyita
     sma_result = ta.sma(quotes, period=period, value='close')
     
     # Get values
     values = close_data
     
-    # Calculate expected SMA by direct computation
+    # Calculate expected SMA by direct computation: sum of every window
     expected_sma = np.full(len(values), np.nan, dtype=np.float64)
-    for i in range(period - 1, len(values)):
-        expected_sma[i] = values[i - period + 1: i + 1].sum() / period
+    windows = np.lib.stride_tricks.sliding_window_view(values, period)
+    expected_sma[period - 1:] = windows.sum(axis=1) / period
     
     # Compare using arrays_equal_with_nan
     assert arrays_equal_with_nan(
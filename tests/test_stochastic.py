@@ -1,4 +1,5 @@
 """Tests for Stochastic Oscillator indicator."""
+import numpy as np
 import pytest
 import pyita as ta
 
@@ -13,17 +14,8 @@ from stock_indicators_helpers import get_si_ref
     (2, 5, 3),
     (14, 5, 3),
 ])
-def test_stochastic_vs_si(test_ohlcv_data, period, period_d, smooth):
+def test_stochastic_vs_si(quotes, period, period_d, smooth):
     """Test Stochastic Oscillator calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     stoch_result = ta.stochastic(quotes, period=period, period_d=period_d, smooth=smooth, ma_type='sma')
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_stoch', period, period_d, smooth)
@@ -40,3 +32,69 @@ def test_stochastic_vs_si(test_ohlcv_data, period, period_d, smooth):
     assert arrays_equal_with_nan(
         stoch_result.value_d, ref.d
     ), f"Stochastic %D (period_d={period_d}) does not match stock-indicators"
+
+
+@pytest.mark.parametrize('nan_series', [None, 'high', 'low', 'close'])
+@pytest.mark.parametrize('period', [1, 5, 14])
+def test_stochastic_batch(test_ohlcv_data, period, nan_series):
+    """Test batch %K calculation against single-instrument calculation."""
+    from pyita.indicators import stochastic
+
+    data = {key: test_ohlcv_data[key].copy() for key in ('open', 'high', 'low', 'close')}
+    if nan_series is not None:
+        data[nan_series][10] = np.nan
+        data[nan_series][3000:3003] = np.nan
+
+    data_len = len(data['close']) - 2
+    quotes_list = []
+    for shift in range(3):
+        quotes_list.append(ta.Quotes(
+            data['open'][shift:shift + data_len],
+            data['high'][shift:shift + data_len],
+            data['low'][shift:shift + data_len],
+            data['close'][shift:shift + data_len],
+        ))
+
+    batch_results = stochastic.batch(quotes_list, period=period)
+
+    assert len(batch_results) == len(quotes_list)
+    for quotes, batch_result in zip(quotes_list, batch_results):
+        stoch_result = ta.stochastic(quotes, period=period, period_d=1, smooth=1)
+        assert arrays_equal_with_nan(
+            batch_result.oscillator, stoch_result.oscillator
+        ), f"Batch stochastic oscillator (period={period}) with NaN in {nan_series} does not match single calculation"
+
+
+@pytest.mark.parametrize('nan_series', ['close', 'high', 'low'])
+@pytest.mark.parametrize('period, period_d, smooth', [
+    (1, 1, 1),
+    (5, 3, 3),
+    (5, 1, 3),
+    (14, 5, 1),
+])
+def test_stochastic_sma_with_nan(test_ohlcv_data, nan_series, period, period_d, smooth):
+    """Test fused SMA stochastic on data with NaN values against calc_k + ma_calculate."""
+    from pyita.indicators.stochastic import calc_k
+    from pyita.move_average import MA_Type, ma_calculate
+
+    data = {key: test_ohlcv_data[key].copy() for key in ('open', 'high', 'low', 'close')}
+    data[nan_series][500] = np.nan
+    data[nan_series][3000:3010] = np.nan
+    quotes = ta.Quotes(data['open'], data['high'], data['low'], data['close'])
+
+    stoch_result = ta.stochastic(quotes, period=period, period_d=period_d, smooth=smooth, ma_type='sma')
+
+    oscillator = calc_k(data['high'], data['low'], data['close'], period)
+    value_k = ma_calculate(oscillator, smooth, MA_Type.sma)
+    value_d = ma_calculate(value_k, period_d, MA_Type.sma)
+
+    for name, expected in (('oscillator', oscillator), ('value_k', value_k), ('value_d', value_d)):
+        assert arrays_equal_with_nan(
+            stoch_result[name], expected
+        ), f"Stochastic {name} with NaN in {nan_series} (period={period}, smooth={smooth}, period_d={period_d}) does not match calc_k + ma_calculate"
+
+    # Smoothing with width 1 must pass its input through unchanged
+    if smooth == 1:
+        assert np.array_equal(stoch_result.value_k, stoch_result.oscillator, equal_nan=True)
+    if period_d == 1:
+        assert np.array_equal(stoch_result.value_d, stoch_result.value_k, equal_nan=True)
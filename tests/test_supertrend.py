@@ -7,17 +7,8 @@ from stock_indicators_helpers import get_si_ref
 
 
 @pytest.mark.parametrize('period', [2, 20])
-def test_supertrend_vs_si(test_ohlcv_data, period):
+def test_supertrend_vs_si(quotes, period):
     """Test Supertrend calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     supertrend_result = ta.supertrend(quotes, period=period, multipler=3, ma_type='mma')
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_super_trend', period, 3)
@@ -12,17 +12,8 @@ from stock_indicators_helpers import get_si_ref
     22,
     14,
 ])
-def test_tema_vs_si(test_ohlcv_data, period):
+def test_tema_vs_si(quotes, period):
     """Test TEMA calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     tema_result = ta.tema(quotes, period=period)
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_tema', period)
@@ -12,17 +12,8 @@ from stock_indicators_helpers import get_si_ref
     22,
     14,
 ])
-def test_trix_vs_si(test_ohlcv_data, period):
+def test_trix_vs_si(quotes, period):
     """Test TRIX calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     trix_result = ta.trix(quotes, period=period)
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_trix', period)
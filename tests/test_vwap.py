@@ -1,4 +1,5 @@
 """Tests for VWAP indicator."""
+import numpy as np
 import pytest
 import pyita as ta
 
@@ -6,17 +7,8 @@ from conftest import TEST_DATA_FILENAME, arrays_equal_with_nan
 from stock_indicators_helpers import get_si_ref
 
 
-def test_vwap_vs_si(test_ohlcv_data):
+def test_vwap_vs_si(quotes):
     """Test VWAP calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     vwap_result = ta.vwap(quotes)
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_vwap')
@@ -25,3 +17,19 @@ def test_vwap_vs_si(test_ohlcv_data):
         vwap_result.vwap, ref.vwap
     ), "VWAP does not match stock-indicators"
 
+
+
+def test_vwap_keeps_numpy_error_state(test_ohlcv_data):
+    """Test that VWAP calculation does not change global NumPy error handling."""
+    quotes = ta.Quotes(
+        test_ohlcv_data['open'],
+        test_ohlcv_data['high'],
+        test_ohlcv_data['low'],
+        test_ohlcv_data['close'],
+        test_ohlcv_data['volume'],
+    )
+
+    with np.errstate(divide='warn', invalid='warn'):
+        err_state = np.geterr()
+        ta.vwap(quotes)
+        assert np.geterr() == err_state
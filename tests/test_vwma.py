@@ -1,4 +1,5 @@
 """Tests for VWMA indicator."""
+import numpy as np
 import pytest
 import pyita as ta
 
@@ -6,22 +7,31 @@ from conftest import TEST_DATA_FILENAME, arrays_equal_with_nan
 from stock_indicators_helpers import get_si_ref
 
 
+def vwma_calculate_vectorized(values, volume, period):
+    """Calculate Volume Weighted Moving Average with cumulative sums.
+    
+    NumPy-only counterpart of vwma_calculate: window sums are taken as
+    differences of zero-padded cumulative sums. It loses precision on long
+    series, so it only serves as an independent reference for the tests.
+    """
+    cum_pv = np.concatenate(([0.0], np.cumsum(values * volume)))
+    cum_v = np.concatenate(([0.0], np.cumsum(volume)))
+
+    vwma = np.empty(len(values), dtype=np.float64)
+    vwma[: period - 1] = np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vwma[period - 1:] = (cum_pv[period:] - cum_pv[:-period]) / (cum_v[period:] - cum_v[:-period])
+
+    return vwma
+
+
 @pytest.mark.parametrize('period', [
     2,
     14,
     15,
 ])
-def test_vwma_vs_si(test_ohlcv_data, period):
+def test_vwma_vs_si(quotes, period):
     """Test VWMA calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     vwma_result = ta.vwma(quotes, period=period)
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_vwma', period)
@@ -30,3 +40,16 @@ def test_vwma_vs_si(test_ohlcv_data, period):
         vwma_result.vwma, ref.vwma
     ), f"VWMA (period={period}) does not match stock-indicators"
 
+
+
+@pytest.mark.parametrize('period', [1, 2, 14])
+def test_vwma_vectorized(test_ohlcv_data, period):
+    """Test cumulative-sum VWMA against the njit kernel."""
+    from pyita.indicators.vwma import vwma_calculate
+
+    close = test_ohlcv_data['close']
+    volume = test_ohlcv_data['volume']
+
+    assert arrays_equal_with_nan(
+        vwma_calculate_vectorized(close, volume, period), vwma_calculate(close, volume, period)
+    ), f"Vectorized VWMA (period={period}) does not match njit kernel"
@@ -1,4 +1,5 @@
 """Tests for Williams %R indicator."""
+import numpy as np
 import pytest
 import pyita as ta
 
@@ -7,23 +8,13 @@ from stock_indicators_helpers import get_si_ref
 
 
 @pytest.mark.parametrize('period', [
-    2,
     1,
+    2,
     5,
     22,
-    22,
 ])
-def test_williams_r_vs_si(test_ohlcv_data, period):
+def test_williams_r_vs_si(quotes, period):
     """Test Williams %R calculation against stock-indicators reference."""
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
     williams_r_result = ta.williams_r(quotes, period=period)
 
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_williams_r', period)
@@ -32,3 +23,34 @@ def test_williams_r_vs_si(test_ohlcv_data, period):
         williams_r_result.williams_r, ref.williams_r
     ), f"Williams %R (period={period}) does not match stock-indicators"
 
+
+
+@pytest.mark.parametrize('nan_series', [None, 'high', 'low', 'close'])
+@pytest.mark.parametrize('period', [1, 5, 14])
+def test_williams_r_batch(test_ohlcv_data, period, nan_series):
+    """Test batch Williams %R calculation against single-instrument calculation."""
+    from pyita.indicators import williams_r
+
+    data = {key: test_ohlcv_data[key].copy() for key in ('open', 'high', 'low', 'close')}
+    if nan_series is not None:
+        data[nan_series][10] = np.nan
+        data[nan_series][3000:3003] = np.nan
+
+    data_len = len(data['close']) - 2
+    quotes_list = []
+    for shift in range(3):
+        quotes_list.append(ta.Quotes(
+            data['open'][shift:shift + data_len],
+            data['high'][shift:shift + data_len],
+            data['low'][shift:shift + data_len],
+            data['close'][shift:shift + data_len],
+        ))
+
+    batch_results = williams_r.batch(quotes_list, period=period)
+
+    assert len(batch_results) == len(quotes_list)
+    for quotes, batch_result in zip(quotes_list, batch_results):
+        williams_r_result = ta.williams_r(quotes, period=period)
+        assert arrays_equal_with_nan(
+            batch_result.williams_r, williams_r_result.williams_r
+        ), f"Batch Williams %R (period={period}) with NaN in {nan_series} does not match single calculation"
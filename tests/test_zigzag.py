@@ -7,18 +7,27 @@ from conftest import TEST_DATA_FILENAME, arrays_equal_with_nan
 from stock_indicators_helpers import get_si_ref
 
 
+def test_zigzag_end_points(quotes):
+    """Test that ZigZag with end_points=True runs and returns well-formed pivots."""
+    zigzag = ta.zigzag(quotes, delta=0.02, depth=1, type='high_low', end_points=True)
+
+    assert len(zigzag.pivot_types) == len(quotes.close)
+    assert np.isin(zigzag.pivot_types, (-1, 0, 1)).all()
+    assert np.array_equal(np.isnan(zigzag.pivots), zigzag.pivot_types == 0)
+
+
 @pytest.mark.parametrize('delta, type_param', [
     (0.02, 'high_low'),
     (0.01, 'high_low'),
     (0.01, 'close'),
 ])
-def test_zigzag_vs_si(test_ohlcv_data, delta, type_param):
+def test_zigzag_vs_si(quotes, delta, type_param):
     """Test ZigZag calculation against stock-indicators reference.
     
     This test:
     1. Loads test OHLCV data
-    2. Creates Quotes object
-    3. Calculates ZigZag using pyita (with and without end_points)
+    2. Uses shared Quotes object
+    3. Calculates ZigZag using pyita
     4. Verifies that ZigZag pivot types match stock-indicators
     5. Allows up to 2% difference due to algorithm differences
     
@@ -28,19 +37,6 @@ def test_zigzag_vs_si(test_ohlcv_data, delta, type_param):
     Note: Comparison starts from the 3rd pivot because the reference
     library calculates initial pivots slightly differently.
     """
-    quotes = ta.Quotes(
-        test_ohlcv_data['open'],
-        test_ohlcv_data['high'],
-        test_ohlcv_data['low'],
-        test_ohlcv_data['close'],
-        test_ohlcv_data['volume'],
-        test_ohlcv_data['time'],
-    )
-
-    # First call - just check it doesn't crash with end_points=True
-    zigzag_with_endpoints = ta.zigzag(quotes, delta=delta, depth=1, type=type_param, end_points=True)
-    
-    # Second call - actual test
     zigzag = ta.zigzag(quotes, delta=delta, depth=1, type=type_param, end_points=False)
 
     # Map type to EndType string (converted to enum inside get_si_ref only when generating data)
@@ -56,16 +52,10 @@ def test_zigzag_vs_si(test_ohlcv_data, delta, type_param):
     # Pass string instead of enum - conversion happens inside get_si_ref only when needed
     ref = get_si_ref(TEST_DATA_FILENAME, 'get_zig_zag', end_type_map[type_param], delta * 100)
 
-    # Convert reference point_type to numeric format
+    # Convert reference point_type ('H', 'L' or None) to numeric format
     ref_point_type = np.zeros(len(ref.point_type), dtype=np.int8)
-    # Handle string values and None
-    for i, val in enumerate(ref.point_type):
-        if val == 'H':
-            ref_point_type[i] = 1
-        elif val == 'L':
-            ref_point_type[i] = -1
-        else:
-            ref_point_type[i] = 0
+    ref_point_type[ref.point_type == 'H'] = 1
+    ref_point_type[ref.point_type == 'L'] = -1
 
     # Start checking from the 3rd pivot (index 2)
     non_zero_indices = np.flatnonzero(zigzag.pivot_types != 0)
@@ -76,7 +66,9 @@ def test_zigzag_vs_si(test_ohlcv_data, delta, type_param):
         min_len = min(len(zigzag.pivot_types) - i_start_check, len(ref_point_type) - i_start_check)
         
         # Calculate difference ratio
-        diff_ratio = (zigzag.pivot_types[i_start_check:i_start_check + min_len] != ref_point_type[i_start_check:i_start_check + min_len]).sum() / min_len
+        pivot_types = zigzag.pivot_types[i_start_check:i_start_check + min_len]
+        ref_types = ref_point_type[i_start_check:i_start_check + min_len]
+        diff_ratio = np.count_nonzero(pivot_types != ref_types) / min_len
         
         assert diff_ratio < 0.002, f"ZigZag (delta={delta}, type={type_param}) differs by {diff_ratio:.2%}, expected < 2%"
 